@@ -7,8 +7,8 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 cd "$SCRIPT_DIR"
 
-# Output directory
-DIST_DIR="$SCRIPT_DIR/dist"
+# Output directory (override with DIST_DIR to build into a private location)
+DIST_DIR="${DIST_DIR:-$SCRIPT_DIR/dist}"
 mkdir -p "$DIST_DIR"
 
 # Detect current platform if not specified
@@ -49,14 +49,22 @@ build_for_platform() {
 
     echo "Building for $os/$arch -> $output"
 
+    # Number of packages (and their cgo compiler invocations) built in parallel
+    local jobs=()
+    if [ -n "$BUILD_JOBS" ]; then
+        jobs=(-p "$BUILD_JOBS")
+    fi
+
     if [ -n "$cc" ]; then
         CGO_ENABLED=1 GOOS="$os" GOARCH="$arch" CC="$cc" go build \
+            "${jobs[@]}" \
             -buildmode=c-shared \
             -ldflags="-s -w" \
             -o "$output" \
             .
     else
         CGO_ENABLED=1 GOOS="$os" GOARCH="$arch" go build \
+            "${jobs[@]}" \
             -buildmode=c-shared \
             -ldflags="-s -w" \
             -o "$output" \
@@ -184,6 +192,8 @@ usage() {
     echo "Environment variables:"
     echo "  TARGET_OS    Target OS (linux, darwin, windows)"
     echo "  TARGET_ARCH  Target architecture (amd64, arm64)"
+    echo "  DIST_DIR     Output directory (default: ./dist)"
+    echo "  BUILD_JOBS   Parallel build jobs passed to go build -p (default: CPU count)"
 }
 
 # Main
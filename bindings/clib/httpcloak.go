@@ -116,6 +116,9 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"os"
+	"runtime"
+	"strconv"
 	"sync"
 	"time"
 	"unsafe"
@@ -187,6 +190,7 @@ var (
 	callbackMu      sync.Mutex
 	callbackCounter int64
 	asyncCallbacks  = make(map[int64]C.async_callback)
+	rawCallbacks    = make(map[int64]bool)               // Callbacks that receive raw response handles
 	cancelFuncs     = make(map[int64]context.CancelFunc) // For cancelling in-flight async requests
 )
 
@@ -549,6 +553,23 @@ func makeRawResponse(resp *httpcloak.Response) int64 {
 		resp.Body.Close()
 	}
 
+	metaJSON := makeResponseMetadata(resp, len(bodyBytes))
+
+	// Store the raw response
+	rawResponsesMu.Lock()
+	rawResponseID++
+	id := rawResponseID
+	rawResponses[id] = &RawResponse{
+		metadata: metaJSON,
+		body:     bodyBytes,
+	}
+	rawResponsesMu.Unlock()
+
+	return id
+}
+
+// makeResponseMetadata encodes everything about a response except its body
+func makeResponseMetadata(resp *httpcloak.Response, bodyLen int) []byte {
 	// Parse cookies from Set-Cookie header
 	cookies := parseSetCookieHeaders(resp.Headers)
 
@@ -569,25 +590,14 @@ func makeRawResponse(resp *httpcloak.Response) int64 {
 	meta := ResponseMetadata{
 		StatusCode: resp.StatusCode,
 		Headers:    resp.Headers,
-		BodyLen:    len(bodyBytes),
+		BodyLen:    bodyLen,
 		FinalURL:   resp.FinalURL,
 		Protocol:   resp.Protocol,
 		Cookies:    cookies,
 		History:    history,
 	}
 	metaJSON, _ := json.Marshal(meta)
-
-	// Store the raw response
-	rawResponsesMu.Lock()
-	rawResponseID++
-	id := rawResponseID
-	rawResponses[id] = &RawResponse{
-		metadata: metaJSON,
-		body:     bodyBytes,
-	}
-	rawResponsesMu.Unlock()
-
-	return id
+	return metaJSON
 }
 
 //export httpcloak_response_get_metadata
@@ -675,10 +685,12 @@ func httpcloak_response_copy_body_to(handle C.int64_t, dest unsafe.Pointer, dest
 
 //export httpcloak_response_free
 func httpcloak_response_free(handle C.int64_t) {
+	freeRawResponse(int64(handle))
+}
+
+func freeRawResponse(handle int64) {
 	rawResponsesMu.Lock()
-	if _, exists := rawResponses[int64(handle)]; exists {
-		delete(rawResponses, int64(handle))
-	}
+	delete(rawResponses, handle)
 	rawResponsesMu.Unlock()
 }
 
@@ -714,15 +726,9 @@ func httpcloak_response_finalize(handle C.int64_t, dest unsafe.Pointer, destLen
 	return C.CString(string(metadata))
 }
 
-//export httpcloak_get_raw
-func httpcloak_get_raw(handle C.int64_t, url *C.char, optionsJSON *C.char) C.int64_t {
-	session := getSession(handle)
-	if session == nil {
-		return -1
-	}
-
-	urlStr := C.GoString(url)
-
+// newGetRequest builds a GET request and its timeout context from the C
+// arguments shared by the raw GET entry points
+func newGetRequest(url *C.char, optionsJSON *C.char) (context.Context, context.CancelFunc, *httpcloak.Request) {
 	var options RequestOptions
 	if optionsJSON != nil {
 		jsonStr := C.GoString(optionsJSON)
@@ -731,20 +737,29 @@ func httpcloak_get_raw(handle C.int64_t, url *C.char, optionsJSON *C.char) C.int
 		}
 	}
 
-	ctx := context.Background()
-	var cancel context.CancelFunc
+	timeout := 30 * time.Second
 	if options.Timeout > 0 {
-		ctx, cancel = context.WithTimeout(ctx, time.Duration(options.Timeout)*time.Millisecond)
-	} else {
-		ctx, cancel = context.WithTimeout(ctx, 30*time.Second)
+		timeout = time.Duration(options.Timeout) * time.Millisecond
 	}
-	defer cancel()
+	ctx, cancel := context.WithTimeout(context.Background(), timeout)
 
 	req := &httpcloak.Request{
 		Method:  "GET",
-		URL:     urlStr,
+		URL:     C.GoString(url),
 		Headers: convertHeaders(options.Headers),
 	}
+	return ctx, cancel, req
+}
+
+//export httpcloak_get_raw
+func httpcloak_get_raw(handle C.int64_t, url *C.char, optionsJSON *C.char) C.int64_t {
+	session := getSession(handle)
+	if session == nil {
+		return -1
+	}
+
+	ctx, cancel, req := newGetRequest(url, optionsJSON)
+	defer cancel()
 
 	resp, err := session.Do(ctx, req)
 	if err != nil {
@@ -754,6 +769,202 @@ func httpcloak_get_raw(handle C.int64_t, url *C.char, optionsJSON *C.char) C.int
 	return C.int64_t(makeRawResponse(resp))
 }
 
+// bodyPool is a reusable response body buffer. Bodies read through
+// httpcloak_get_into land in buf, which stays pinned so the caller can view
+// it in place. The caller must not start another request on the pool, or
+// free it, while it still holds a view of the previous body. buf's capacity
+// is always a power of two so callers see only a handful of distinct sizes.
+type bodyPool struct {
+	mu      sync.Mutex
+	buf     []byte
+	initial int
+	pinner  runtime.Pinner
+}
+
+var (
+	bodyPools   = make(map[int64]*bodyPool)
+	bodyPoolsMu sync.Mutex
+	bodyPoolID  int64
+)
+
+// poolCap returns the smallest power-of-two pool capacity that holds n bytes.
+func poolCap(n int) int {
+	c := 4096
+	for c < n {
+		c <<= 1
+	}
+	return c
+}
+
+const (
+	// maxPoolPrealloc caps how much a Content-Length header may make fill
+	// grow the pool up front; larger bodies still fit, they just grow as
+	// data actually arrives.
+	maxPoolPrealloc = 8 << 20
+
+	// maxPoolRetain is the largest buffer a pool keeps once a body is done
+	// with; trim drops anything bigger back to the initial size.
+	maxPoolRetain = 8 << 20
+)
+
+// fill reads r into the pool buffer, growing it if needed, and returns the body.
+// sizeHint is the expected body length (-1 if unknown); when it exceeds the
+// current capacity the buffer is grown once instead of doubling its way up.
+// The previous body must no longer be viewed by the caller.
+func (p *bodyPool) fill(r io.ReadCloser, sizeHint int64) ([]byte, error) {
+	p.pinner.Unpin()
+
+	// One spare byte past the body lets the read that sees EOF skip a regrow
+	if sizeHint > 0 && sizeHint <= maxPoolPrealloc && int(sizeHint) >= cap(p.buf) {
+		p.buf = make([]byte, 0, poolCap(int(sizeHint)+1))
+	}
+
+	body := p.buf[:0]
+	var err error
+	if r != nil {
+		for {
+			if len(body) == cap(body) {
+				grown := make([]byte, len(body), poolCap(len(body)+1))
+				copy(grown, body)
+				body = grown
+			}
+			var n int
+			n, err = r.Read(body[len(body):cap(body)])
+			body = body[:len(body)+n]
+			if err != nil {
+				break
+			}
+		}
+		if errors.Is(err, io.EOF) {
+			err = nil
+		}
+		r.Close()
+	}
+
+	// Keep the full capacity (possibly grown above) for the next request
+	p.buf = body[:cap(body)]
+	if cap(p.buf) > 0 {
+		p.pinner.Pin(&p.buf[0])
+	}
+	return body, err
+}
+
+// trim shrinks a buffer grown past maxPoolRetain back to its initial size.
+// Like fill, it must only be called once the previous body is not viewed.
+func (p *bodyPool) trim() {
+	if cap(p.buf) > maxPoolRetain {
+		p.pinner.Unpin()
+		p.buf = make([]byte, 0, p.initial)
+	}
+}
+
+// contentLength returns the Content-Length header value, or -1 if it is
+// missing or malformed.
+func contentLength(headers map[string][]string) int64 {
+	vals := headers["content-length"]
+	if len(vals) == 0 {
+		return -1
+	}
+	n, err := strconv.ParseInt(vals[0], 10, 64)
+	if err != nil {
+		return -1
+	}
+	return n
+}
+
+//export httpcloak_pool_new
+func httpcloak_pool_new(initialSize C.size_t) C.int64_t {
+	bodyPoolsMu.Lock()
+	bodyPoolID++
+	id := bodyPoolID
+	size := poolCap(int(initialSize))
+	bodyPools[id] = &bodyPool{buf: make([]byte, 0, size), initial: size}
+	bodyPoolsMu.Unlock()
+	return C.int64_t(id)
+}
+
+// httpcloak_pool_trim releases an oversized pool buffer once the caller is
+// done with the body in it, so one large response does not pin that much
+// memory for the rest of the pool's life.
+//
+//export httpcloak_pool_trim
+func httpcloak_pool_trim(pool C.int64_t) {
+	bodyPoolsMu.Lock()
+	p := bodyPools[int64(pool)]
+	bodyPoolsMu.Unlock()
+
+	if p != nil {
+		p.mu.Lock()
+		p.trim()
+		p.mu.Unlock()
+	}
+}
+
+//export httpcloak_pool_free
+func httpcloak_pool_free(pool C.int64_t) {
+	bodyPoolsMu.Lock()
+	p, exists := bodyPools[int64(pool)]
+	delete(bodyPools, int64(pool))
+	bodyPoolsMu.Unlock()
+
+	if exists {
+		p.mu.Lock()
+		p.pinner.Unpin()
+		p.buf = nil
+		p.mu.Unlock()
+	}
+}
+
+// httpcloak_get_into performs a GET and reads the body into a pool created by
+// httpcloak_pool_new, reusing its buffer instead of allocating per response.
+// The body pointer, length and the capacity of the buffer behind it are
+// written to outPtr, outLen and outCap and stay valid until the next
+// httpcloak_get_into on the same pool or httpcloak_pool_free.
+// Returns the response metadata JSON (or an error JSON); free it with
+// httpcloak_free_string.
+//
+//export httpcloak_get_into
+func httpcloak_get_into(handle C.int64_t, pool C.int64_t, url *C.char, optionsJSON *C.char, outPtr *unsafe.Pointer, outLen *C.size_t, outCap *C.size_t) *C.char {
+	*outPtr = nil
+	*outLen = 0
+	*outCap = 0
+
+	session := getSession(handle)
+	if session == nil {
+		return makeErrorJSON(errors.New("invalid session handle"))
+	}
+
+	bodyPoolsMu.Lock()
+	p := bodyPools[int64(pool)]
+	bodyPoolsMu.Unlock()
+	if p == nil {
+		return makeErrorJSON(errors.New("invalid pool handle"))
+	}
+
+	ctx, cancel, req := newGetRequest(url, optionsJSON)
+	defer cancel()
+
+	resp, err := session.Do(ctx, req)
+	if err != nil {
+		return makeErrorJSON(err)
+	}
+
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	body, err := p.fill(resp.Body, contentLength(resp.Headers))
+	if err != nil {
+		return makeErrorJSON(err)
+	}
+
+	if len(body) > 0 {
+		*outPtr = unsafe.Pointer(&body[0])
+		*outLen = C.size_t(len(body))
+		*outCap = C.size_t(cap(body))
+	}
+	return C.CString(string(makeResponseMetadata(resp, len(body))))
+}
+
 //export httpcloak_post_raw
 func httpcloak_post_raw(handle C.int64_t, url *C.char, body *C.char, bodyLen C.int, optionsJSON *C.char) C.int64_t {
 	session := getSession(handle)
@@ -881,6 +1092,35 @@ func httpcloak_session_new(configJSON *C.char) C.int64_t {
 		}
 	}
 
+	return newSessionHandle(config)
+}
+
+// httpcloak_session_new2 creates a session from the common options passed
+// positionally, skipping the JSON config round-trip of httpcloak_session_new.
+// proxy may be NULL or empty for a direct connection.
+//
+//export httpcloak_session_new2
+func httpcloak_session_new2(preset *C.char, proxy *C.char, timeout C.int, retry C.int) C.int64_t {
+	config := SessionConfig{
+		Preset:      "chrome-145",
+		Timeout:     int(timeout),
+		HTTPVersion: "auto",
+		Retry:       int(retry),
+	}
+	if preset != nil {
+		if p := C.GoString(preset); p != "" {
+			config.Preset = p
+		}
+	}
+	if proxy != nil {
+		config.Proxy = C.GoString(proxy)
+	}
+
+	return newSessionHandle(config)
+}
+
+// newSessionHandle builds a session from config and registers it
+func newSessionHandle(config SessionConfig) C.int64_t {
 	var opts []httpcloak.SessionOption
 	if config.Proxy != "" {
 		opts = append(opts, httpcloak.WithSessionProxy(config.Proxy))
@@ -1319,10 +1559,26 @@ func httpcloak_register_callback(callback C.async_callback) C.int64_t {
 	return C.int64_t(id)
 }
 
+// httpcloak_register_callback_raw registers a callback like
+// httpcloak_register_callback, but its response is delivered as a raw
+// response handle (see makeAsyncResponseJSON) rather than JSON with the body.
+//
+//export httpcloak_register_callback_raw
+func httpcloak_register_callback_raw(callback C.async_callback) C.int64_t {
+	callbackMu.Lock()
+	callbackCounter++
+	id := callbackCounter
+	asyncCallbacks[id] = callback
+	rawCallbacks[id] = true
+	callbackMu.Unlock()
+	return C.int64_t(id)
+}
+
 //export httpcloak_unregister_callback
 func httpcloak_unregister_callback(callbackID C.int64_t) {
 	callbackMu.Lock()
 	delete(asyncCallbacks, int64(callbackID))
+	delete(rawCallbacks, int64(callbackID))
 	delete(cancelFuncs, int64(callbackID))
 	callbackMu.Unlock()
 }
@@ -1344,10 +1600,18 @@ func invokeCallback(callbackID int64, responseJSON string, errStr string) {
 	if exists {
 		delete(asyncCallbacks, callbackID)
 	}
+	delete(rawCallbacks, callbackID)
 	delete(cancelFuncs, callbackID)
 	callbackMu.Unlock()
 
 	if !exists {
+		// Nobody will read a raw handle made for this callback; free it here.
+		// The payload is checked rather than rawCallbacks, which an
+		// unregister may already have cleared.
+		var handle int64
+		if _, err := fmt.Sscanf(responseJSON, `{"raw_handle":%d}`, &handle); err == nil {
+			freeRawResponse(handle)
+		}
 		return
 	}
 
@@ -1371,6 +1635,56 @@ func invokeCallback(callbackID int64, responseJSON string, errStr string) {
 	}
 }
 
+// makeAsyncResponseJSON encodes a completed async response for its callback.
+// Callbacks registered with httpcloak_register_callback_raw only receive
+// {"raw_handle":N}: the body stays in Go instead of being embedded in JSON,
+// and is read with the raw response functions (httpcloak_response_get_metadata,
+// httpcloak_response_copy_body_to, httpcloak_response_free).
+func makeAsyncResponseJSON(callbackID int64, resp *httpcloak.Response) string {
+	callbackMu.Lock()
+	raw := rawCallbacks[callbackID]
+	callbackMu.Unlock()
+
+	if raw {
+		return fmt.Sprintf(`{"raw_handle":%d}`, makeRawResponse(resp))
+	}
+
+	// Read body from io.ReadCloser
+	var bodyBytes []byte
+	if resp.Body != nil {
+		bodyBytes, _ = io.ReadAll(resp.Body)
+		resp.Body.Close()
+	}
+
+	// Parse cookies from Set-Cookie header
+	cookies := parseSetCookieHeaders(resp.Headers)
+
+	// Convert redirect history
+	var history []RedirectInfo
+	if len(resp.History) > 0 {
+		history = make([]RedirectInfo, len(resp.History))
+		for i, h := range resp.History {
+			history[i] = RedirectInfo{
+				StatusCode: h.StatusCode,
+				URL:        h.URL,
+				Headers:    h.Headers,
+			}
+		}
+	}
+
+	data := ResponseData{
+		StatusCode: resp.StatusCode,
+		Headers:    resp.Headers,
+		Body:       string(bodyBytes),
+		FinalURL:   resp.FinalURL,
+		Protocol:   resp.Protocol,
+		Cookies:    cookies,
+		History:    history,
+	}
+	jsonData, _ := json.Marshal(data)
+	return string(jsonData)
+}
+
 //export httpcloak_get_async
 func httpcloak_get_async(handle C.int64_t, url *C.char, optionsJSON *C.char, callbackID C.int64_t) {
 	session := getSession(handle)
@@ -1412,40 +1726,7 @@ func httpcloak_get_async(handle C.int64_t, url *C.char, optionsJSON *C.char, cal
 			return
 		}
 
-		// Read body from io.ReadCloser
-		var bodyBytes []byte
-		if resp.Body != nil {
-			bodyBytes, _ = io.ReadAll(resp.Body)
-			resp.Body.Close()
-		}
-
-		// Parse cookies from Set-Cookie header
-		cookies := parseSetCookieHeaders(resp.Headers)
-
-		// Convert redirect history
-		var history []RedirectInfo
-		if len(resp.History) > 0 {
-			history = make([]RedirectInfo, len(resp.History))
-			for i, h := range resp.History {
-				history[i] = RedirectInfo{
-					StatusCode: h.StatusCode,
-					URL:        h.URL,
-					Headers:    h.Headers,
-				}
-			}
-		}
-
-		data := ResponseData{
-			StatusCode: resp.StatusCode,
-			Headers:    resp.Headers,
-			Body:       string(bodyBytes),
-			FinalURL:   resp.FinalURL,
-			Protocol:   resp.Protocol,
-			Cookies:    cookies,
-			History:    history,
-		}
-		jsonData, _ := json.Marshal(data)
-		invokeCallback(int64(callbackID), string(jsonData), "")
+		invokeCallback(int64(callbackID), makeAsyncResponseJSON(int64(callbackID), resp), "")
 	}()
 }
 
@@ -1500,40 +1781,7 @@ func httpcloak_post_async(handle C.int64_t, url *C.char, body *C.char, optionsJS
 			return
 		}
 
-		// Read body from io.ReadCloser
-		var bodyBytes []byte
-		if resp.Body != nil {
-			bodyBytes, _ = io.ReadAll(resp.Body)
-			resp.Body.Close()
-		}
-
-		// Parse cookies from Set-Cookie header
-		cookies := parseSetCookieHeaders(resp.Headers)
-
-		// Convert redirect history
-		var history []RedirectInfo
-		if len(resp.History) > 0 {
-			history = make([]RedirectInfo, len(resp.History))
-			for i, h := range resp.History {
-				history[i] = RedirectInfo{
-					StatusCode: h.StatusCode,
-					URL:        h.URL,
-					Headers:    h.Headers,
-				}
-			}
-		}
-
-		data := ResponseData{
-			StatusCode: resp.StatusCode,
-			Headers:    resp.Headers,
-			Body:       string(bodyBytes),
-			FinalURL:   resp.FinalURL,
-			Protocol:   resp.Protocol,
-			Cookies:    cookies,
-			History:    history,
-		}
-		jsonData, _ := json.Marshal(data)
-		invokeCallback(int64(callbackID), string(jsonData), "")
+		invokeCallback(int64(callbackID), makeAsyncResponseJSON(int64(callbackID), resp), "")
 	}()
 }
 
@@ -1598,40 +1846,7 @@ func httpcloak_request_async(handle C.int64_t, requestJSON *C.char, callbackID C
 			return
 		}
 
-		// Read body from io.ReadCloser
-		var bodyBytes []byte
-		if resp.Body != nil {
-			bodyBytes, _ = io.ReadAll(resp.Body)
-			resp.Body.Close()
-		}
-
-		// Parse cookies from Set-Cookie header
-		cookies := parseSetCookieHeaders(resp.Headers)
-
-		// Convert redirect history
-		var history []RedirectInfo
-		if len(resp.History) > 0 {
-			history = make([]RedirectInfo, len(resp.History))
-			for i, h := range resp.History {
-				history[i] = RedirectInfo{
-					StatusCode: h.StatusCode,
-					URL:        h.URL,
-					Headers:    h.Headers,
-				}
-			}
-		}
-
-		data := ResponseData{
-			StatusCode: resp.StatusCode,
-			Headers:    resp.Headers,
-			Body:       string(bodyBytes),
-			FinalURL:   resp.FinalURL,
-			Protocol:   resp.Protocol,
-			Cookies:    cookies,
-			History:    history,
-		}
-		jsonData, _ := json.Marshal(data)
-		invokeCallback(int64(callbackID), string(jsonData), "")
+		invokeCallback(int64(callbackID), makeAsyncResponseJSON(int64(callbackID), resp), "")
 	}()
 }
 
@@ -1661,6 +1876,27 @@ func httpcloak_set_cookie(handle C.int64_t, name *C.char, value *C.char) {
 	session.SetCookie(C.GoString(name), C.GoString(value))
 }
 
+// httpcloak_set_cookies sets several cookies from a JSON object of
+// name -> value in one call. Returns NULL on success or an error JSON.
+//
+//export httpcloak_set_cookies
+func httpcloak_set_cookies(handle C.int64_t, cookiesJSON *C.char) *C.char {
+	session := getSession(handle)
+	if session == nil {
+		return makeErrorJSON(ErrInvalidSession)
+	}
+
+	var cookies map[string]string
+	if err := json.Unmarshal([]byte(C.GoString(cookiesJSON)), &cookies); err != nil {
+		return makeErrorJSON(err)
+	}
+
+	for name, value := range cookies {
+		session.SetCookie(name, value)
+	}
+	return nil
+}
+
 // ============================================================================
 // Session Persistence
 // ============================================================================
@@ -2953,17 +3189,45 @@ func httpcloak_stream_read_raw(streamHandle C.int64_t, buffer unsafe.Pointer, bu
 	}
 
 	// Create a Go slice backed by the C buffer
-	buf := (*[1 << 30]byte)(buffer)[:size:size]
+	buf := unsafe.Slice((*byte)(buffer), size)
 
 	n, err := stream.Read(buf)
-	if err != nil {
-		if err.Error() == "EOF" {
-			return 0 // EOF
-		}
+	// Readers such as compress/gzip return the final bytes together with
+	// io.EOF; deliver them now, the next call reports EOF as 0
+	if n > 0 {
+		return C.int(n)
+	}
+	if err != nil && !errors.Is(err, io.EOF) {
 		return -1 // Error
 	}
+	return 0 // EOF
+}
 
-	return C.int(n)
+// httpcloak_stream_write_to copies the rest of the stream straight into an
+// OS file descriptor (a HANDLE on Windows) so the body never passes through
+// the caller's memory. Always takes ownership of fd and closes it, on error
+// too; callers that want to keep their file open should pass a dup. Returns
+// the number of bytes written, or -1 on error.
+//
+//export httpcloak_stream_write_to
+func httpcloak_stream_write_to(streamHandle C.int64_t, fd C.int64_t) C.int64_t {
+	// Wrap fd before anything can fail so every path below closes it
+	f := os.NewFile(uintptr(fd), "httpcloak-stream")
+	if f == nil {
+		return -1
+	}
+	defer f.Close()
+
+	stream := getStream(int64(streamHandle))
+	if stream == nil {
+		return -1
+	}
+
+	n, err := io.Copy(f, stream)
+	if err != nil {
+		return -1
+	}
+	return C.int64_t(n)
 }
 
 //export httpcloak_stream_close
@@ -4,15 +4,42 @@ Build platform-specific wheels for httpcloak.
 
 This script builds wheels with bundled native libraries for each platform.
 Run this on each target platform or use CI/CD to build all wheels.
+
+Several platforms can be built in one run (--platform all, or a comma
+separated list). Each target is built in its own process and writes into
+its own build/<plat>/ and dist/<plat>/ directories, so targets never
+share intermediate files.
+
+Built native libraries are cached in ~/.cache/httpcloak/native, keyed by
+a hash of the Go sources, target platform and toolchain versions. Set
+HTTPCLOAK_NO_BUILD_CACHE=1 to always rebuild.
 """
 
+import hashlib
+import importlib.util
 import os
-import platform
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+
+def _load_platform_module():
+    """
+    Load httpcloak/_platform.py by path. Importing it through the package
+    would run httpcloak/__init__.py, which loads the native library when
+    HTTPCLOAK_EAGER_LOAD=1 and fails before anything has been built.
+    """
+    path = Path(__file__).parent / "httpcloak" / "_platform.py"
+    spec = importlib.util.spec_from_file_location("_httpcloak_platform", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_platform = _load_platform_module()
+
 # Wheel platform tags
 PLATFORM_TAGS = {
     ("linux", "amd64"): "manylinux_2_17_x86_64",
@@ -23,37 +50,210 @@ PLATFORM_TAGS = {
     ("windows", "arm64"): "win_arm64",
 }
 
-LIB_EXTENSIONS = {
-    "linux": ".so",
-    "darwin": ".dylib",
-    "windows": ".dll",
+# C cross compilers for cgo, as picked by build.sh's build_all. macOS
+# targets have none: they are only buildable on macOS with the host clang.
+CROSS_COMPILERS = {
+    ("linux", "arm64"): "aarch64-linux-gnu-gcc",
+    ("windows", "amd64"): "x86_64-w64-mingw32-gcc",
+    ("windows", "arm64"): "aarch64-w64-mingw32-gcc",
 }
 
+# Compiler cache launchers, in order of preference for --cache-backend auto
+COMPILER_CACHES = ("ccache", "sccache")
+
+# Top-level directories of the repository that are not part of the Go library
+NON_LIBRARY_DIRS = ("bindings", "examples")
+
+# Files and directories that make up the package source
+PACKAGE_FILES = ["pyproject.toml", "README.md"]
+PACKAGE_DIR = "httpcloak"
+
+
+class BuildError(Exception):
+    """Raised when a build step fails."""
+    pass
+
 
 def get_current_platform():
     """Detect current platform."""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    # Unknown architectures default to amd64, the only tag every OS has
+    os_name, arch = _platform.OS_NAME, _platform.ARCH
+    if (os_name, arch) not in PLATFORM_TAGS:
+        arch = "amd64"
+    return os_name, arch
 
-    if system == "darwin":
-        os_name = "darwin"
-    elif system == "windows":
-        os_name = "windows"
-    else:
-        os_name = "linux"
 
-    if machine in ("x86_64", "amd64"):
-        arch = "amd64"
-    elif machine in ("aarch64", "arm64"):
-        arch = "arm64"
-    else:
-        arch = "amd64"
+def target_compiler(os_name, arch):
+    """
+    C compiler for a target, or None to use the default one.
+
+    Raises BuildError if the target needs a cross compiler that is not on PATH.
+    """
+    host_os, host_arch = get_current_platform()
+    if (os_name, arch) == (host_os, host_arch):
+        return None
+    if os_name == "darwin":
+        if host_os == "darwin":
+            return None
+        raise BuildError(f"{os_name}/{arch} can only be built on macOS")
+
+    cc = CROSS_COMPILERS[(os_name, arch)]
+    if not shutil.which(cc):
+        raise BuildError(f"No cross-compiler for {os_name}/{arch}: {cc} not found on PATH")
+    return cc
+
+
+def parse_platforms(value):
+    """Parse the --platform argument into a list of (os_name, arch) pairs."""
+    if value == "native":
+        return [get_current_platform()]
+    if value == "all":
+        # Like build.sh's build_all, skip targets without a toolchain
+        targets = []
+        for target in PLATFORM_TAGS:
+            try:
+                target_compiler(*target)
+            except BuildError as e:
+                print(f"Skipping {target[0]}-{target[1]}: {e}")
+                continue
+            targets.append(target)
+        return targets
+
+    targets = []
+    for name in value.split(","):
+        name = name.strip()
+        if name == "native":
+            target = get_current_platform()
+        else:
+            target = tuple(name.split("-", 1))
+        if target not in PLATFORM_TAGS:
+            raise ValueError(f"Unknown platform: {name}")
+        if target not in targets:
+            targets.append(target)
+    return targets
+
+
+def find_compiler_cache(backend):
+    """Resolve a --cache-backend value to a launcher name on PATH, or None."""
+    if backend == "none":
+        return None
+
+    candidates = COMPILER_CACHES if backend == "auto" else (backend,)
+    for name in candidates:
+        if shutil.which(name):
+            return name
+
+    if backend != "auto":
+        raise BuildError(f"Compiler cache not found on PATH: {backend}")
+    return None
+
+
+def apply_compiler_cache(env, launcher, os_name):
+    """Wrap the C/C++ compilers used by cgo with a compiler cache launcher."""
+    cc = env.get("CC") or ("clang" if os_name == "darwin" else "gcc")
+    cxx = env.get("CXX") or ("clang++" if os_name == "darwin" else "g++")
+    env["CC"] = f"{launcher} {cc}"
+    env["CXX"] = f"{launcher} {cxx}"
+
+    # Stable cache location so it survives between runs and CI jobs
+    cache_root = Path.home() / ".cache"
+    if launcher == "ccache":
+        env.setdefault("CCACHE_DIR", str(cache_root / "httpcloak-ccache"))
+        # Hash the compiler binary itself, so different toolchains
+        # with the same name (cross compilers) never share entries
+        env.setdefault("CCACHE_COMPILERCHECK", "content")
+    elif launcher == "sccache":
+        env.setdefault("SCCACHE_DIR", str(cache_root / "httpcloak-sccache"))
+
+
+def native_sources():
+    """List every file the native library build depends on, in a stable order."""
+    clib_dir = Path(__file__).parent.parent / "clib"
+    repo_root = clib_dir.parent.parent
+
+    # clib uses "replace github.com/sardanioss/httpcloak => ../.." so the
+    # root module's Go sources are compiled into the library as well
+    files = [repo_root / "go.mod", repo_root / "go.sum"]
+    for path in repo_root.rglob("*.go"):
+        rel = path.relative_to(repo_root)
+        if rel.parts[0] in NON_LIBRARY_DIRS or path.name.endswith("_test.go"):
+            continue
+        files.append(path)
+
+    files += [clib_dir / "go.mod", clib_dir / "go.sum", clib_dir / "build.sh"]
+    files += [p for p in clib_dir.glob("*.go") if not p.name.endswith("_test.go")]
+    return sorted(p for p in files if p.exists())
+
+
+def _tool_version(cmd):
+    """Return the version banner of a build tool, or an empty string."""
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError:
+        return ""
+    return result.stdout.strip()
+
+
+def native_cache_key(os_name, arch, env):
+    """
+    Hash of the library sources, target platform and toolchain versions.
+
+    env must already carry the CC chosen for the target (see
+    target_compiler), so cross builds are keyed on their cross compiler
+    rather than on the host gcc.
+    """
+    repo_root = Path(__file__).parent.parent.parent
+    h = hashlib.sha256()
+    for path in native_sources():
+        h.update(str(path.relative_to(repo_root)).encode())
+        h.update(b"\0")
+        h.update(path.read_bytes())
+        h.update(b"\0")
+
+    cc = env.get("CC") or ("clang" if os_name == "darwin" else "gcc")
+    for part in (os_name, arch, _tool_version(["go", "version"]), cc, _tool_version(cc.split() + ["--version"])):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def native_cache_dir():
+    """Directory holding previously built native libraries, or None if disabled."""
+    if os.environ.get("HTTPCLOAK_NO_BUILD_CACHE") == "1":
+        return None
+    return Path.home() / ".cache" / "httpcloak" / "native"
+
+
+def run_step(cmd, cwd, env=None, log_path=None):
+    """
+    Run a build command.
+
+    When log_path is given, stdout and stderr are appended to that file so
+    parallel builds don't interleave their output. Otherwise the command
+    inherits our stdout/stderr and its output streams live.
+    """
+    if log_path is not None:
+        with open(log_path, "a") as log:
+            result = subprocess.run(cmd, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT)
+        if result.returncode != 0:
+            raise BuildError(f"Command failed: {' '.join(cmd)} (see {log_path})")
+        return
+
+    # Flush our own buffered output first so it stays in order with the child's
+    sys.stdout.flush()
+    result = subprocess.run(cmd, cwd=cwd, env=env)
+    if result.returncode != 0:
+        raise BuildError(f"Command failed: {' '.join(cmd)} (exit code {result.returncode})")
 
-    return os_name, arch
 
+def build_native_library(os_name, arch, out_dir, log_path=None, jobs=None, cache=None):
+    """
+    Build the native library for the specified platform into out_dir.
 
-def build_native_library(os_name, arch):
-    """Build the native library for the specified platform."""
+    jobs is the number of parallel compile jobs handed to go build (-p),
+    which also bounds how many cgo compiler processes run at once.
+    cache is an optional compiler cache launcher (ccache or sccache).
+    """
     script_dir = Path(__file__).parent
     clib_dir = script_dir.parent / "clib"
 
@@ -62,92 +262,144 @@ def build_native_library(os_name, arch):
     env = os.environ.copy()
     env["TARGET_OS"] = os_name
     env["TARGET_ARCH"] = arch
-
-    result = subprocess.run(
-        ["bash", "build.sh", "native"],
-        cwd=clib_dir,
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        print(f"Build failed: {result.stderr}")
-        sys.exit(1)
-
-    print(result.stdout)
+    # Cross targets always get their own compiler; an inherited CC only
+    # applies to the host target. Set before the cache key is computed,
+    # which hashes the version of the compiler actually used.
+    cc = target_compiler(os_name, arch)
+    if cc:
+        env["CC"] = cc
+    env["DIST_DIR"] = str(out_dir)
+    if jobs:
+        env["BUILD_JOBS"] = str(jobs)
+
+    lib_name = _platform.lib_name(os_name, arch)
+
+    # Reuse a library built from identical sources by an earlier run
+    cache_dir = native_cache_dir()
+    cached_lib = None
+    if cache_dir is not None:
+        cached_lib = cache_dir / native_cache_key(os_name, arch, env) / lib_name
+        if cached_lib.exists():
+            print(f"Using cached native library: {cached_lib}")
+            # Still publish it in out_dir, where --skip-build looks for it.
+            # Copied, not linked, so a later build writing there cannot
+            # modify the cache entry.
+            lib_path = Path(out_dir) / lib_name
+            lib_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(cached_lib, lib_path)
+            return lib_path
+
+    if cache:
+        apply_compiler_cache(env, cache, os_name)
+
+    run_step(["bash", "build.sh", "native"], cwd=clib_dir, env=env, log_path=log_path)
 
     # Find the built library
-    ext = LIB_EXTENSIONS[os_name]
-    lib_name = f"libhttpcloak-{os_name}-{arch}{ext}"
-    lib_path = clib_dir / "dist" / lib_name
+    lib_path = Path(out_dir) / lib_name
 
     if not lib_path.exists():
-        print(f"Library not found: {lib_path}")
-        sys.exit(1)
+        raise BuildError(f"Library not found: {lib_path}")
+
+    if cached_lib is not None:
+        cached_lib.parent.mkdir(parents=True, exist_ok=True)
+        # Copy under a temporary name first so concurrent runs never see a partial file
+        tmp = cached_lib.with_name(f"{lib_name}.{os.getpid()}.tmp")
+        shutil.copy2(lib_path, tmp)
+        os.replace(tmp, cached_lib)
 
     return lib_path
 
 
-def copy_library_to_package(lib_path, os_name, arch):
-    """Copy the native library to the package directory."""
+def find_built_library(os_name, arch):
+    """Locate a previously built native library (for --skip-build)."""
+    clib_dir = Path(__file__).parent.parent / "clib"
+    lib_name = _platform.lib_name(os_name, arch)
+
+    for candidate in (clib_dir / "dist" / f"{os_name}-{arch}" / lib_name, clib_dir / "dist" / lib_name):
+        if candidate.exists():
+            return candidate
+
+    raise BuildError(f"Library not found: {lib_name}\nRun without --skip-build first")
+
+
+def stage_package(src_dir):
+    """Copy the package sources into a private build directory."""
     script_dir = Path(__file__).parent
-    lib_dir = script_dir / "httpcloak" / "lib"
+
+    if src_dir.exists():
+        shutil.rmtree(src_dir)
+    src_dir.mkdir(parents=True)
+
+    for name in PACKAGE_FILES:
+        shutil.copy2(script_dir / name, src_dir / name)
+    shutil.copytree(
+        script_dir / PACKAGE_DIR,
+        src_dir / PACKAGE_DIR,
+        ignore=shutil.ignore_patterns("__pycache__", "lib", "libhttpcloak-*"),
+    )
+
+    return src_dir
+
+
+def copy_library_to_package(lib_path, os_name, arch, package_dir):
+    """
+    Place the native library into the (staged) package directory.
+
+    The library is hardlinked when possible and only copied when source and
+    destination are on different filesystems.
+    """
+    lib_dir = Path(package_dir) / "lib"
     lib_dir.mkdir(parents=True, exist_ok=True)
 
+    dest = lib_dir / lib_path.name
+    if dest.exists() and os.path.samefile(dest, lib_path):
+        print(f"{lib_path.name} already in {lib_dir}")
+        return dest
+
     # Clean existing libraries
     for f in lib_dir.glob("libhttpcloak-*"):
         f.unlink()
 
-    # Copy the library
-    dest = lib_dir / lib_path.name
-    shutil.copy2(lib_path, dest)
-    print(f"Copied {lib_path.name} to {lib_dir}")
+    try:
+        os.link(lib_path, dest)
+        print(f"Linked {lib_path.name} into {lib_dir}")
+    except OSError:
+        shutil.copy2(lib_path, dest)
+        print(f"Copied {lib_path.name} to {lib_dir}")
 
     return dest
 
 
-def build_wheel(os_name, arch):
-    """Build a platform-specific wheel."""
-    script_dir = Path(__file__).parent
-
+def build_wheel(os_name, arch, src_dir, dist_dir, log_path=None):
+    """Build a platform-specific wheel from src_dir into dist_dir."""
     plat_tag = PLATFORM_TAGS.get((os_name, arch))
     if not plat_tag:
-        print(f"Unknown platform: {os_name}/{arch}")
-        sys.exit(1)
+        raise BuildError(f"Unknown platform: {os_name}/{arch}")
 
     print(f"Building wheel for {plat_tag}...")
 
     # Clean previous builds
-    for d in ["build", "dist", "httpcloak.egg-info"]:
-        p = script_dir / d
-        if p.exists():
-            shutil.rmtree(p)
+    if dist_dir.exists():
+        shutil.rmtree(dist_dir)
+    dist_dir.mkdir(parents=True)
 
     # Build the wheel
-    result = subprocess.run(
+    run_step(
         [
             sys.executable, "-m", "pip", "wheel",
             "--no-deps",
-            "--wheel-dir", "dist",
+            "--wheel-dir", str(dist_dir),
             ".",
         ],
-        cwd=script_dir,
-        capture_output=True,
-        text=True,
+        cwd=src_dir,
+        log_path=log_path,
     )
 
-    if result.returncode != 0:
-        print(f"Wheel build failed: {result.stderr}")
-        sys.exit(1)
-
     # Find the built wheel and rename it with correct platform tag
-    dist_dir = script_dir / "dist"
     wheels = list(dist_dir.glob("httpcloak-*.whl"))
 
     if not wheels:
-        print("No wheel found!")
-        sys.exit(1)
+        raise BuildError("No wheel found!")
 
     old_wheel = wheels[0]
 
@@ -164,6 +416,37 @@ def build_wheel(os_name, arch):
     return new_wheel
 
 
+def build_target(os_name, arch, skip_build=False, use_log=False, jobs=None, cache=None):
+    """Build the native library and wheel for one platform. Returns the wheel path."""
+    script_dir = Path(__file__).parent
+    plat = f"{os_name}-{arch}"
+    clib_dir = script_dir.parent / "clib"
+    work_dir = script_dir / "build" / plat
+    dist_dir = script_dir / "dist" / plat
+
+    work_dir.mkdir(parents=True, exist_ok=True)
+    log_path = None
+    if use_log:
+        log_path = work_dir / "build.log"
+        log_path.write_text("")
+
+    try:
+        if not skip_build:
+            lib_path = build_native_library(
+                os_name, arch, clib_dir / "dist" / plat,
+                log_path=log_path, jobs=jobs, cache=cache,
+            )
+        else:
+            lib_path = find_built_library(os_name, arch)
+
+        src_dir = stage_package(work_dir / "src")
+        copy_library_to_package(lib_path, os_name, arch, src_dir / PACKAGE_DIR)
+        return build_wheel(os_name, arch, src_dir, dist_dir, log_path=log_path)
+    finally:
+        # Keep each worker's progress output together
+        sys.stdout.flush()
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -171,51 +454,103 @@ def main():
     parser = argparse.ArgumentParser(description="Build httpcloak wheels")
     parser.add_argument(
         "--platform",
-        choices=["linux-amd64", "linux-arm64", "darwin-amd64", "darwin-arm64",
-                 "windows-amd64", "windows-arm64", "native"],
         default="native",
-        help="Target platform (default: native)",
+        help="Target platform: native (default), all, or a comma separated list "
+             "(e.g. linux-amd64,darwin-arm64). Available: "
+             + ", ".join(f"{o}-{a}" for o, a in PLATFORM_TAGS),
     )
     parser.add_argument(
         "--skip-build",
         action="store_true",
         help="Skip building native library (use existing)",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of platforms to build in parallel (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--cache-backend",
+        choices=["auto", "ccache", "sccache", "none"],
+        default="auto",
+        help="Compiler cache for the native build (default: auto, first found on PATH)",
+    )
 
     args = parser.parse_args()
 
-    if args.platform == "native":
-        os_name, arch = get_current_platform()
-    else:
-        os_name, arch = args.platform.split("-")
+    try:
+        targets = parse_platforms(args.platform)
+    except ValueError as e:
+        parser.error(str(e))
 
-    print(f"=== Building httpcloak wheel for {os_name}/{arch} ===")
+    cache = None
+    if not args.skip_build:
+        try:
+            cache = find_compiler_cache(args.cache_backend)
+        except BuildError as e:
+            parser.error(str(e))
+        if cache:
+            print(f"Using compiler cache: {cache}")
+
+    names = ", ".join(f"{o}/{a}" for o, a in targets)
+    print(f"=== Building httpcloak wheel for {names} ===")
     print()
 
-    if not args.skip_build:
-        lib_path = build_native_library(os_name, arch)
-    else:
-        script_dir = Path(__file__).parent
-        clib_dir = script_dir.parent / "clib"
-        ext = LIB_EXTENSIONS[os_name]
-        lib_path = clib_dir / "dist" / f"libhttpcloak-{os_name}-{arch}{ext}"
-        if not lib_path.exists():
-            print(f"Library not found: {lib_path}")
-            print("Run without --skip-build first")
+    # Oversubscribe the compiler 2x per core, split between concurrent targets
+    cpus = os.cpu_count() or 1
+    workers = max(1, min(args.jobs, len(targets)))
+    jobs_per_target = max(1, (2 * cpus) // workers)
+
+    wheels = []
+    failed = []
+    if len(targets) == 1:
+        os_name, arch = targets[0]
+        try:
+            wheels.append(build_target(
+                os_name, arch, skip_build=args.skip_build, jobs=jobs_per_target, cache=cache,
+            ))
+        except BuildError as e:
+            print(f"Build failed: {e}")
             sys.exit(1)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    build_target, os_name, arch,
+                    skip_build=args.skip_build, use_log=True, jobs=jobs_per_target, cache=cache,
+                ): (os_name, arch)
+                for os_name, arch in targets
+            }
+            for future in as_completed(futures):
+                os_name, arch = futures[future]
+                try:
+                    wheel_path = future.result()
+                except BuildError as e:
+                    print(f"  Failed: {os_name}/{arch}: {e}")
+                    failed.append((os_name, arch))
+                else:
+                    print(f"  Built: {os_name}/{arch} -> {wheel_path}")
+                    wheels.append(wheel_path)
 
-    copy_library_to_package(lib_path, os_name, arch)
-    wheel_path = build_wheel(os_name, arch)
-
-    print()
-    print("=== Build complete! ===")
-    print(f"Wheel: {wheel_path}")
     print()
-    print("To install:")
-    print(f"  pip install {wheel_path}")
+    if failed:
+        print("=== Build finished with errors ===")
+    else:
+        print("=== Build complete! ===")
+    for wheel_path in wheels:
+        print(f"Wheel: {wheel_path}")
     print()
-    print("To upload to PyPI:")
-    print(f"  twine upload {wheel_path}")
+    if wheels:
+        print("To install:")
+        print(f"  pip install {wheels[0]}")
+        print()
+        print("To upload to PyPI:")
+        print(f"  twine upload {' '.join(str(w) for w in wheels)}")
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
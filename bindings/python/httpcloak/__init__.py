@@ -28,6 +28,8 @@ Example:
         print(r.json())
 """
 
+import os
+
 from .client import (
     # Classes
     Session,
@@ -83,3 +85,9 @@ __all__ = [
     "get_ech_dns_servers",
 ]
 __version__ = "1.6.1b2"
+
+# Load the native library at import time instead of on first request
+if os.environ.get("HTTPCLOAK_EAGER_LOAD") == "1":
+    from .client import _get_lib
+
+    _get_lib()
@@ -0,0 +1,36 @@
+"""
+Platform naming for the native library.
+
+Shared by the runtime loader (client.py) and build_wheels.py so both agree
+on how libhttpcloak-<os>-<arch><ext> is named. Evaluated once at import.
+"""
+
+import platform
+
+LIB_EXTENSIONS = {
+    "linux": ".so",
+    "darwin": ".dylib",
+    "windows": ".dll",
+}
+
+_ARCH_ALIASES = {
+    "x86_64": "amd64",
+    "amd64": "amd64",
+    "aarch64": "arm64",
+    "arm64": "arm64",
+}
+
+
+def lib_name(os_name: str, arch: str) -> str:
+    """File name of the native library for a platform."""
+    return f"libhttpcloak-{os_name}-{arch}{LIB_EXTENSIONS[os_name]}"
+
+
+_system = platform.system().lower()
+_machine = platform.machine().lower()
+
+# Anything that is not macOS or Windows loads the Linux build
+OS_NAME = _system if _system in ("darwin", "windows") else "linux"
+ARCH = _ARCH_ALIASES.get(_machine, _machine)
+LIB_EXT = LIB_EXTENSIONS[OS_NAME]
+LIB_NAME = lib_name(OS_NAME, ARCH)
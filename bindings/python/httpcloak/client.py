@@ -18,20 +18,92 @@ Example:
 """
 
 import asyncio
+import atexit
 import base64
+import ctypes
 import json
 import mimetypes
 import os
-import platform
 import time
 import uuid
-from ctypes import c_char_p, c_int, c_int64, c_void_p, cdll, cast, CFUNCTYPE, POINTER
+import weakref
+from contextlib import ExitStack
+from functools import lru_cache
+from ctypes import c_char_p, c_int, c_int64, c_size_t, c_void_p, cdll, cast, CFUNCTYPE, POINTER
 from io import IOBase
 from pathlib import Path
-from threading import Lock
+from threading import Lock, RLock
 from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode, quote
 
+from ._platform import LIB_NAME
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 JSON bytes for the native library.
+
+    Uses orjson when installed (pip install httpcloak[fast]), falling back to
+    the stdlib for objects orjson rejects (e.g. non-string dict keys).
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON produced by the native library (bytes or str)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+# Sentinel for lazily computed attributes whose value may legitimately be None
+_UNSET = object()
+
+
+@lru_cache(maxsize=256)
+def _encode_header_items(items: Tuple[Tuple[str, str], ...]) -> bytes:
+    return _json_dumps({"headers": dict(items)})
+
+
+# Never memoized: the process-wide cache would keep these values alive
+# after the session that sent them is closed
+_SENSITIVE_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie"})
+
+
+def _encode_header_options(headers: Optional[Dict[str, str]]) -> Optional[bytes]:
+    """
+    Encode the {"headers": {...}} options JSON expected by the clib.
+
+    Memoized on the header items (in order, since header order matters for
+    fingerprinting), so callers reusing the same headers skip serialization.
+    Headers carrying credentials or cookies are always encoded afresh.
+    """
+    if not headers:
+        return None
+    if any(name.lower() in _SENSITIVE_HEADERS for name in headers):
+        return _json_dumps({"headers": headers})
+    try:
+        return _encode_header_items(tuple(headers.items()))
+    except TypeError:
+        # Unhashable header values - encode without caching
+        return _json_dumps({"headers": headers})
+
+
+@lru_cache(maxsize=4096)
+def _utf8(s: str) -> bytes:
+    """UTF-8 encode a URL or cookie name, memoized for hot request loops."""
+    return s.encode("utf-8")
+
 
 # File type for files parameter
 FileValue = Union[
@@ -309,7 +381,7 @@ class Response:
     Attributes:
         status_code: HTTP status code
         headers: Response headers
-        text: Response body as string
+        text: Response body as string (decoded lazily on first access)
         content: Response body as bytes
         url: Final URL after redirects
         ok: True if status_code < 400
@@ -321,12 +393,18 @@ class Response:
         history: List of redirect responses (RedirectInfo objects)
     """
 
+    # Slots instead of a per-instance __dict__: responses are created per request
+    __slots__ = (
+        "status_code", "headers", "content", "_text", "_json", "url", "protocol",
+        "elapsed", "cookies", "history", "body", "final_url",
+    )
+
     def __init__(
         self,
         status_code: int,
         headers: Dict[str, str],
         body: bytes,
-        text: str,
+        text: Optional[str],
         final_url: str,
         protocol: str,
         elapsed: float = 0.0,
@@ -336,7 +414,8 @@ class Response:
         self.status_code = status_code
         self.headers = headers
         self.content = body  # requests compatibility
-        self.text = text
+        self._text = text  # None until first access of .text
+        self._json = _UNSET  # parsed on first json() call
         self.url = final_url  # requests compatibility
         self.protocol = protocol
         self.elapsed = elapsed  # seconds as float
@@ -347,6 +426,18 @@ class Response:
         self.body = body
         self.final_url = final_url
 
+    @property
+    def text(self) -> str:
+        """Response body as string (decoded on first access, then cached)."""
+        if self._text is None:
+            self._text = self.content.decode("utf-8", errors="replace")
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        self._text = value
+        self._json = _UNSET
+
     @property
     def ok(self) -> bool:
         """True if status_code < 400."""
@@ -375,8 +466,24 @@ class Response:
         return None
 
     def json(self, **kwargs) -> Any:
-        """Parse response body as JSON."""
-        return json.loads(self.text, **kwargs)
+        """
+        Parse response body as JSON.
+
+        Without kwargs the body bytes are parsed directly, skipping the
+        .text decode, and the result is cached, so repeated calls return
+        the same object. Passing kwargs always parses afresh.
+        """
+        if kwargs:
+            return json.loads(self.text, **kwargs)
+        if self._json is _UNSET:
+            # Stdlib rather than orjson: orjson turns ints wider than 64 bits
+            # into floats, which a requests-style json() must not do
+            try:
+                self._json = json.loads(self._text if self._text is not None else self.content)
+            except UnicodeDecodeError:
+                # Invalid UTF-8: parse the lossy .text, as before
+                self._json = json.loads(self.text)
+        return self._json
 
     def raise_for_status(self):
         """Raise HTTPCloakError if status_code >= 400."""
@@ -385,14 +492,17 @@ class Response:
 
     @classmethod
     def _from_dict(cls, data: dict, elapsed: float = 0.0, raw_body: Optional[bytes] = None) -> "Response":
-        # Use raw_body if provided (optimized path), otherwise parse from dict
+        # Use raw_body if provided (optimized path), otherwise parse from dict.
+        # Text is only known up front when the body arrives as a string;
+        # otherwise it is decoded lazily by Response.text.
+        text = None
         if raw_body is not None:
             body_bytes = raw_body
-            body = raw_body.decode("utf-8", errors="replace")
         else:
             body = data.get("body", "")
             if isinstance(body, str):
                 body_bytes = body.encode("utf-8")
+                text = body
             else:
                 body_bytes = body
 
@@ -426,7 +536,7 @@ class Response:
             status_code=data.get("status_code", 0),
             headers=data.get("headers") or {},
             body=body_bytes,
-            text=body if isinstance(body, str) else body.decode("utf-8", errors="replace"),
+            text=text,
             final_url=data.get("final_url", ""),
             protocol=data.get("protocol", ""),
             elapsed=elapsed,
@@ -439,8 +549,10 @@ class FastResponse:
     """
     High-performance HTTP Response using zero-copy memoryview.
 
-    WARNING: The content memoryview is only valid until the next fast request
-    on the same session. Copy the data if you need to keep it longer.
+    NOTE: The content memoryview is a read-only window onto a native body
+    buffer, which stays reserved for as long as the view (or any slice of
+    it) is referenced. Copy the data and drop the view if you need to keep
+    it longer, so the buffer can be reused.
 
     This provides ~5000-6500 MB/s download speeds compared to ~1100 MB/s
     for regular Response by avoiding memory copies.
@@ -463,12 +575,17 @@ class FastResponse:
     Example:
         # Fast path - process data immediately
         resp = session.get_fast("https://example.com/large-file")
-        process_data(resp.content)  # memoryview, valid until next get_fast()
+        process_data(resp.content)  # memoryview over the native buffer
 
         # If you need to keep the data
         data = resp.content_bytes  # creates a copy
     """
 
+    __slots__ = (
+        "status_code", "headers", "content", "url", "final_url", "protocol",
+        "elapsed", "cookies", "history",
+    )
+
     def __init__(
         self,
         status_code: int,
@@ -528,11 +645,17 @@ class FastResponse:
 
     @property
     def text(self) -> str:
-        """Get content as string (creates a copy)."""
-        return bytes(self.content).decode("utf-8", errors="replace")
+        """Get content as string (decoded straight from the memoryview)."""
+        return str(self.content, "utf-8", "replace")
 
     def json(self, **kwargs) -> Any:
-        """Parse response body as JSON (creates a copy)."""
+        """
+        Parse response body as JSON.
+
+        The body is decoded straight from the memoryview into the str the
+        stdlib parser needs, with no intermediate bytes copy. orjson is not
+        used: it turns ints wider than 64 bits into floats.
+        """
         return json.loads(self.text, **kwargs)
 
     def raise_for_status(self):
@@ -582,6 +705,69 @@ class _FastBufferPool:
 # Global fast buffer pool (one per process)
 _fast_buffer_pool = _FastBufferPool()
 
+# Initial capacity of each get_fast() body pool (grows as needed)
+_FAST_POOL_INITIAL_SIZE = 1024 * 1024
+
+# Pools that grew past this (maxPoolRetain in the clib) are trimmed when
+# handed back, so one large body does not stay allocated until close()
+_FAST_POOL_MAX_RETAINED = 8 * 1024 * 1024
+
+
+class _FastPools:
+    """
+    Native body pools lent out by get_fast().
+
+    Each response body is viewed through a ctypes array over its pool
+    buffer. Every memoryview, slice or cast of FastResponse.content keeps
+    that array alive, so a pool is only handed out again (or freed, after
+    close()) once nothing can read its buffer any more.
+    """
+
+    def __init__(self, lib):
+        self._lib = lib
+        # Reentrant: a release() finalizer can run from GC inside acquire()
+        self._lock = RLock()
+        self._idle: List[int] = []
+        self._closed = False
+
+    def acquire(self) -> int:
+        """Return an idle pool, creating one if all are lent out."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._lib.httpcloak_pool_new(_FAST_POOL_INITIAL_SIZE)
+
+    def release(self, pool: int, trim: bool = False):
+        """Take a pool back once nothing views its buffer, shrinking it if asked."""
+        with self._lock:
+            if not self._closed:
+                if trim:
+                    self._lib.httpcloak_pool_trim(pool)
+                self._idle.append(pool)
+                return
+        self._lib.httpcloak_pool_free(pool)
+
+    def lend(self, pool: int, body_ptr: int, body_len: int, body_cap: int) -> memoryview:
+        """Wrap a pool's body in a read-only view that owns the pool until collected."""
+        if body_len <= 0 or not body_ptr:
+            self.release(pool)
+            return memoryview(b"")
+        # Pool capacities are powers of two, so few array types get created
+        exporter = (ctypes.c_char * body_cap).from_address(body_ptr)
+        finalizer = weakref.finalize(
+            exporter, self.release, pool, body_cap > _FAST_POOL_MAX_RETAINED
+        )
+        finalizer.atexit = False
+        return memoryview(exporter).cast("B")[:body_len].toreadonly()
+
+    def close(self):
+        """Free idle pools now; pools still lent out are freed when released."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pool in idle:
+            self._lib.httpcloak_pool_free(pool)
+
 
 class StreamResponse:
     """
@@ -598,6 +784,13 @@ class StreamResponse:
             f.write(chunk)
         r.close()
 
+    Socket I/O underneath is done by Go's network poller (epoll/kqueue/IOCP),
+    so a stream waiting for data parks a goroutine rather than an OS thread.
+    Only the Python thread inside a read call blocks, with the GIL released;
+    drive many concurrent streams from a bounded thread pool, and prefer
+    readinto() or write_to() to keep the number of native calls per
+    megabyte low.
+
     Attributes:
         status_code: HTTP status code
         headers: Response headers
@@ -695,6 +888,85 @@ class StreamResponse:
 
             yield chunk
 
+    def readinto(self, buffer) -> int:
+        """
+        Read response content directly into a writable buffer.
+
+        Data is copied straight from the native stream into `buffer`, with no
+        intermediate bytes object and no base64 round-trip, so one buffer can
+        be reused for the whole download.
+
+        Args:
+            buffer: Writable buffer (bytearray, memoryview, ...)
+
+        Returns:
+            int: Number of bytes read, 0 at end of stream
+
+        Example:
+            buf = memoryview(bytearray(256 * 1024))
+            with session.get_stream(url) as r:
+                while n := r.readinto(buf):
+                    f.write(buf[:n])
+        """
+        if self._closed:
+            raise HTTPCloakError("Stream is closed")
+
+        view = memoryview(buffer).cast("B")
+        size = min(len(view), 0x7FFFFFFF)
+        if size == 0:
+            return 0
+
+        target = (ctypes.c_char * size).from_buffer(view)
+        n = self._lib.httpcloak_stream_read_raw(self._handle, ctypes.addressof(target), size)
+        if n < 0:
+            raise HTTPCloakError("Stream read failed")
+        return n
+
+    def write_to(self, file: BinaryIO) -> int:
+        """
+        Write the rest of the response content to a file.
+
+        For real files on POSIX the native library writes to the file
+        descriptor directly, so the body never enters Python. Other file
+        objects (and Windows) fall back to a reusable readinto() buffer.
+
+        Args:
+            file: Binary file object opened for writing
+
+        Returns:
+            int: Number of bytes written
+
+        Example:
+            with session.get_stream(url) as r, open("out.bin", "wb") as f:
+                r.write_to(f)
+        """
+        if self._closed:
+            raise HTTPCloakError("Stream is closed")
+
+        try:
+            fd = file.fileno()
+        except (AttributeError, OSError):
+            fd = None
+
+        if fd is None or os.name == "nt":
+            total = 0
+            buf = memoryview(bytearray(256 * 1024))
+            while True:
+                n = self.readinto(buf)
+                if not n:
+                    break
+                file.write(buf[:n])
+                total += n
+            return total
+
+        # Anything already buffered on the Python side must land first; the
+        # library owns (and closes) the dup'd descriptor
+        file.flush()
+        n = self._lib.httpcloak_stream_write_to(self._handle, os.dup(fd))
+        if n < 0:
+            raise HTTPCloakError("Stream write failed")
+        return n
+
     def iter_lines(self, chunk_size: int = 8192, decode_unicode: bool = True):
         """
         Iterate over response content line by line.
@@ -706,22 +978,31 @@ class StreamResponse:
         Yields:
             str or bytes: Lines from response content
         """
-        pending = b""
+        # Unfinished line carried between chunks. Appending to a bytearray and
+        # trimming once per chunk keeps this linear; only new data is searched.
+        pending = bytearray()
         for chunk in self.iter_content(chunk_size=chunk_size):
+            scan = len(pending)
             pending += chunk
-            while b"\n" in pending:
-                line, pending = pending.split(b"\n", 1)
+            start = 0
+            while True:
+                end = pending.find(b"\n", scan)
+                if end < 0:
+                    break
                 if decode_unicode:
-                    yield line.decode("utf-8", errors="replace")
+                    yield pending[start:end].decode("utf-8", errors="replace")
                 else:
-                    yield line
+                    yield bytes(pending[start:end])
+                start = scan = end + 1
+            if start:
+                del pending[:start]
 
         # Yield any remaining content
         if pending:
             if decode_unicode:
                 yield pending.decode("utf-8", errors="replace")
             else:
-                yield pending
+                yield bytes(pending)
 
     @property
     def content(self) -> bytes:
@@ -772,42 +1053,49 @@ class StreamResponse:
         return f"<StreamResponse [{self.status_code}]>"
 
 
+# Keeps libraries extracted from zipped installs alive until interpreter exit
+_extracted_libs = ExitStack()
+atexit.register(_extracted_libs.close)
+
+
+def _packaged_lib_path(lib_name: str) -> Optional[str]:
+    """Locate the library bundled in the package's lib/ directory, if any."""
+    try:
+        from importlib import resources
+        ref = resources.files(__package__).joinpath("lib").joinpath(lib_name)
+    except (ImportError, AttributeError):
+        # importlib.resources.files() is Python 3.9+
+        ref = Path(__file__).parent / "lib" / lib_name
+
+    if not ref.is_file():
+        return None
+    if isinstance(ref, Path):
+        return str(ref)
+    # Zipped install: the loader needs a real file on disk
+    return str(_extracted_libs.enter_context(resources.as_file(ref)))
+
+
 def _get_lib_path() -> str:
     """Get the path to the shared library based on platform."""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    lib_name = LIB_NAME
 
-    if machine in ("x86_64", "amd64"):
-        arch = "amd64"
-    elif machine in ("aarch64", "arm64"):
-        arch = "arm64"
-    else:
-        arch = machine
-
-    if system == "darwin":
-        ext = ".dylib"
-        os_name = "darwin"
-    elif system == "windows":
-        ext = ".dll"
-        os_name = "windows"
-    else:
-        ext = ".so"
-        os_name = "linux"
+    env_path = os.environ.get("HTTPCLOAK_LIB_PATH")
+    if env_path and Path(env_path).exists():
+        return env_path
 
-    lib_name = f"libhttpcloak-{os_name}-{arch}{ext}"
+    # Installed wheels ship the library in httpcloak/lib/ - resolve it directly
+    packaged = _packaged_lib_path(lib_name)
+    if packaged:
+        return packaged
 
+    # Development checkouts and system-wide installs
     search_paths = [
         Path(__file__).parent / lib_name,
-        Path(__file__).parent / "lib" / lib_name,
         Path(__file__).parent.parent / "lib" / lib_name,
         Path(f"/usr/local/lib/{lib_name}"),
         Path(f"/usr/lib/{lib_name}"),
     ]
 
-    env_path = os.environ.get("HTTPCLOAK_LIB_PATH")
-    if env_path:
-        search_paths.insert(0, Path(env_path))
-
     for path in search_paths:
         if path.exists():
             return str(path)
@@ -822,15 +1110,21 @@ _lib = None
 _lib_lock = Lock()
 
 
+@lru_cache(maxsize=None)
 def _get_lib():
-    """Get or load the shared library."""
+    """
+    Get or load the shared library.
+
+    After the first call the result is served straight from the cache, so
+    callers pay no global check or lock. The lock only covers the first load,
+    where several threads may miss the cache at once.
+    """
     global _lib
-    if _lib is None:
-        with _lib_lock:
-            if _lib is None:
-                lib_path = _get_lib_path()
-                _lib = cdll.LoadLibrary(lib_path)
-                _setup_lib(_lib)
+    with _lib_lock:
+        if _lib is None:
+            lib_path = _get_lib_path()
+            _lib = cdll.LoadLibrary(lib_path)
+            _setup_lib(_lib)
     return _lib
 
 
@@ -872,11 +1166,23 @@ class _AsyncCallbackManager:
         self._lib = None
 
     def _on_callback(self, callback_id: int, response_json: Optional[bytes], error: Optional[bytes]):
-        """Called from Go goroutine when async request completes."""
+        """
+        Called from Go goroutine when async request completes.
+
+        Callbacks are registered as raw, so response_json is only
+        {"raw_handle": N}; the body is copied straight out of Go here, on the
+        callback thread, instead of being JSON-decoded on the event loop.
+        """
         with self._lock:
-            if callback_id not in self._pending:
-                return
-            future, loop, start_time = self._pending.pop(callback_id)
+            entry = self._pending.pop(callback_id, None)
+        if entry is None:
+            # Nobody is waiting any more - still release the native response
+            if response_json:
+                raw_handle = _json_loads(response_json).get("raw_handle")
+                if raw_handle is not None:
+                    self._lib.httpcloak_response_free(raw_handle)
+            return
+        future, loop, start_time = entry
 
         # Calculate elapsed time
         elapsed = time.perf_counter() - start_time
@@ -893,8 +1199,12 @@ class _AsyncCallbackManager:
             loop.call_soon_threadsafe(future.set_exception, HTTPCloakError(err_msg))
         elif response_json:
             try:
-                data = json.loads(response_json.decode("utf-8"))
-                response = Response._from_dict(data, elapsed=elapsed)
+                data = _json_loads(response_json)
+                raw_handle = data.get("raw_handle")
+                if raw_handle is not None:
+                    response = _parse_raw_response(self._lib, raw_handle, elapsed=elapsed)
+                else:
+                    response = Response._from_dict(data, elapsed=elapsed)
                 loop.call_soon_threadsafe(future.set_result, response)
             except Exception as e:
                 loop.call_soon_threadsafe(future.set_exception, HTTPCloakError(f"Failed to parse response: {e}"))
@@ -914,19 +1224,46 @@ class _AsyncCallbackManager:
         Each request gets a unique callback_id from Go. The callback function
         is shared but Go tracks each request separately by ID.
         """
-        self._ensure_callback(lib)
+        return self.register_requests(lib, 1)[0]
 
-        # Register a NEW callback for this request (Go gives us a unique ID)
-        callback_id = lib.httpcloak_register_callback(self._callback_ref)
+    def register_requests(self, lib, count: int) -> List[Tuple[int, asyncio.Future]]:
+        """
+        Register `count` async requests at once. Returns a list of (callback_id, future).
 
-        # Create future and store it with start time
-        loop = asyncio.get_event_loop()
-        future = loop.create_future()
+        The pending table lock is taken once for the whole batch instead of
+        once per request. Must be called from within a running event loop.
+        """
+        self._ensure_callback(lib)
+
+        loop = asyncio.get_running_loop()
         start_time = time.perf_counter()
+        entries = []
+        for _ in range(count):
+            # Register a NEW callback for each request (Go gives us a unique ID)
+            callback_id = lib.httpcloak_register_callback_raw(self._callback_ref)
+            entries.append((callback_id, loop.create_future()))
+
         with self._lock:
-            self._pending[callback_id] = (future, loop, start_time)
+            for callback_id, future in entries:
+                self._pending[callback_id] = (future, loop, start_time)
+
+        return entries
 
-        return callback_id, future
+    def discard_requests(self, lib, entries: List[Tuple[int, asyncio.Future]]):
+        """
+        Abandon registered requests, e.g. when starting a batch fails partway.
+
+        Requests already started are cancelled in Go, every callback is
+        unregistered so a late completion is dropped there, and the futures
+        are cancelled.
+        """
+        with self._lock:
+            for callback_id, _ in entries:
+                self._pending.pop(callback_id, None)
+        for callback_id, future in entries:
+            lib.httpcloak_cancel_request(callback_id)
+            lib.httpcloak_unregister_callback(callback_id)
+            future.cancel()
 
 
 # Global async callback manager
@@ -945,9 +1282,20 @@ def _get_async_manager() -> _AsyncCallbackManager:
 
 
 def _setup_lib(lib):
-    """Setup function signatures for the library."""
+    """
+    Setup function signatures for the library.
+
+    The library is loaded with cdll (CDLL), so ctypes releases the GIL for
+    the duration of every call below. Blocking requests on one thread
+    therefore don't stall Python code on others, and sync calls from a
+    thread pool run concurrently. This holds as long as no signature uses
+    py_object - keep it that way. Native callbacks (CFUNCTYPE) re-acquire
+    the GIL when they call back into Python.
+    """
     lib.httpcloak_session_new.argtypes = [c_char_p]
     lib.httpcloak_session_new.restype = c_int64
+    lib.httpcloak_session_new2.argtypes = [c_char_p, c_char_p, c_int, c_int]
+    lib.httpcloak_session_new2.restype = c_int64
     lib.httpcloak_session_free.argtypes = [c_int64]
     lib.httpcloak_session_free.restype = None
     lib.httpcloak_session_refresh.argtypes = [c_int64]
@@ -969,6 +1317,8 @@ def _setup_lib(lib):
     lib.httpcloak_get_cookies.restype = c_void_p
     lib.httpcloak_set_cookie.argtypes = [c_int64, c_char_p, c_char_p]
     lib.httpcloak_set_cookie.restype = None
+    lib.httpcloak_set_cookies.argtypes = [c_int64, c_char_p]
+    lib.httpcloak_set_cookies.restype = c_void_p
     lib.httpcloak_free_string.argtypes = [c_void_p]
     lib.httpcloak_free_string.restype = None
     lib.httpcloak_version.argtypes = []
@@ -983,8 +1333,12 @@ def _setup_lib(lib):
     # Async functions
     lib.httpcloak_register_callback.argtypes = [ASYNC_CALLBACK]
     lib.httpcloak_register_callback.restype = c_int64
+    lib.httpcloak_register_callback_raw.argtypes = [ASYNC_CALLBACK]
+    lib.httpcloak_register_callback_raw.restype = c_int64
     lib.httpcloak_unregister_callback.argtypes = [c_int64]
     lib.httpcloak_unregister_callback.restype = None
+    lib.httpcloak_cancel_request.argtypes = [c_int64]
+    lib.httpcloak_cancel_request.restype = None
     lib.httpcloak_get_async.argtypes = [c_int64, c_char_p, c_char_p, c_int64]
     lib.httpcloak_get_async.restype = None
     lib.httpcloak_post_async.argtypes = [c_int64, c_char_p, c_char_p, c_char_p, c_int64]
@@ -1003,6 +1357,10 @@ def _setup_lib(lib):
     lib.httpcloak_stream_get_metadata.restype = c_void_p
     lib.httpcloak_stream_read.argtypes = [c_int64, c_int64]
     lib.httpcloak_stream_read.restype = c_void_p
+    lib.httpcloak_stream_read_raw.argtypes = [c_int64, c_void_p, c_int]
+    lib.httpcloak_stream_read_raw.restype = c_int
+    lib.httpcloak_stream_write_to.argtypes = [c_int64, c_int64]
+    lib.httpcloak_stream_write_to.restype = c_int64
     lib.httpcloak_stream_close.argtypes = [c_int64]
     lib.httpcloak_stream_close.restype = None
 
@@ -1066,6 +1424,20 @@ def _setup_lib(lib):
     lib.httpcloak_response_free.argtypes = [c_int64]
     lib.httpcloak_response_free.restype = None
 
+    # Pooled GET: the body is read into a reusable Go-side buffer and lent out
+    # via (ptr, len, cap) out-parameters until the pool is reused or freed
+    lib.httpcloak_pool_new.argtypes = [c_size_t]
+    lib.httpcloak_pool_new.restype = c_int64
+    lib.httpcloak_pool_trim.argtypes = [c_int64]
+    lib.httpcloak_pool_trim.restype = None
+    lib.httpcloak_pool_free.argtypes = [c_int64]
+    lib.httpcloak_pool_free.restype = None
+    lib.httpcloak_get_into.argtypes = [
+        c_int64, c_int64, c_char_p, c_char_p, POINTER(c_void_p), POINTER(c_size_t),
+        POINTER(c_size_t),
+    ]
+    lib.httpcloak_get_into.restype = c_void_p
+
     # Local proxy functions
     lib.httpcloak_local_proxy_start.argtypes = [c_char_p]
     lib.httpcloak_local_proxy_start.restype = c_int64
@@ -1116,7 +1488,7 @@ def _parse_response(result_ptr, elapsed: float = 0.0) -> Response:
     result = _ptr_to_string(result_ptr)
     if result is None:
         raise HTTPCloakError("No response received")
-    data = json.loads(result)
+    data = _json_loads(result)
     if "error" in data:
         raise HTTPCloakError(data["error"])
     return Response._from_dict(data, elapsed=elapsed)
@@ -1138,7 +1510,7 @@ def _parse_raw_response(lib, response_handle: int, elapsed: float = 0.0) -> Resp
         if meta_str is None:
             raise HTTPCloakError("Empty response metadata")
 
-        data = json.loads(meta_str.decode("utf-8"))
+        data = _json_loads(meta_str)
         if "error" in data:
             raise HTTPCloakError(data["error"])
 
@@ -1169,6 +1541,46 @@ def _parse_raw_response(lib, response_handle: int, elapsed: float = 0.0) -> Resp
         lib.httpcloak_response_free(response_handle)
 
 
+def _fast_response_from_meta(data: dict, content_view: memoryview, elapsed: float) -> FastResponse:
+    """Build a FastResponse from parsed response metadata and a body view."""
+    # Parse cookies from response
+    cookies = []
+    for cookie_data in data.get("cookies") or []:
+        if isinstance(cookie_data, dict):
+            cookies.append(Cookie(
+                name=cookie_data.get("name", ""),
+                value=cookie_data.get("value", ""),
+                domain=cookie_data.get("domain", ""),
+                path=cookie_data.get("path", ""),
+                expires=cookie_data.get("expires", ""),
+                max_age=cookie_data.get("max_age", 0),
+                secure=cookie_data.get("secure", False),
+                http_only=cookie_data.get("http_only", False),
+                same_site=cookie_data.get("same_site", ""),
+            ))
+
+    # Parse redirect history
+    history = []
+    for redirect_data in data.get("history") or []:
+        if isinstance(redirect_data, dict):
+            history.append(RedirectInfo(
+                status_code=redirect_data.get("status_code", 0),
+                url=redirect_data.get("url", ""),
+                headers=redirect_data.get("headers") or {},
+            ))
+
+    return FastResponse(
+        status_code=data.get("status_code", 0),
+        headers=data.get("headers") or {},
+        content_view=content_view,
+        final_url=data.get("final_url", ""),
+        protocol=data.get("protocol", ""),
+        elapsed=elapsed,
+        cookies=cookies,
+        history=history,
+    )
+
+
 def _parse_fast_response(lib, response_handle: int, elapsed: float = 0.0) -> FastResponse:
     """
     Parse response using zero-copy fast path with pre-allocated buffers.
@@ -1188,36 +1600,10 @@ def _parse_fast_response(lib, response_handle: int, elapsed: float = 0.0) -> Fas
         if meta_str is None:
             raise HTTPCloakError("Empty response metadata")
 
-        data = json.loads(meta_str.decode("utf-8"))
+        data = _json_loads(meta_str)
         if "error" in data:
             raise HTTPCloakError(data["error"])
 
-        # Parse cookies from response
-        cookies = []
-        for cookie_data in data.get("cookies") or []:
-            if isinstance(cookie_data, dict):
-                cookies.append(Cookie(
-                    name=cookie_data.get("name", ""),
-                    value=cookie_data.get("value", ""),
-                    domain=cookie_data.get("domain", ""),
-                    path=cookie_data.get("path", ""),
-                    expires=cookie_data.get("expires", ""),
-                    max_age=cookie_data.get("max_age", 0),
-                    secure=cookie_data.get("secure", False),
-                    http_only=cookie_data.get("http_only", False),
-                    same_site=cookie_data.get("same_site", ""),
-                ))
-
-        # Parse redirect history
-        history = []
-        for redirect_data in data.get("history") or []:
-            if isinstance(redirect_data, dict):
-                history.append(RedirectInfo(
-                    status_code=redirect_data.get("status_code", 0),
-                    url=redirect_data.get("url", ""),
-                    headers=redirect_data.get("headers") or {},
-                ))
-
         # Get body length
         body_len = lib.httpcloak_response_get_body_len(response_handle)
 
@@ -1237,22 +1623,29 @@ def _parse_fast_response(lib, response_handle: int, elapsed: float = 0.0) -> Fas
         else:
             content_view = memoryview(b"")
 
-        return FastResponse(
-            status_code=data.get("status_code", 0),
-            headers=data.get("headers") or {},
-            content_view=content_view,
-            final_url=data.get("final_url", ""),
-            protocol=data.get("protocol", ""),
-            elapsed=elapsed,
-            cookies=cookies,
-            history=history,
-        )
+        return _fast_response_from_meta(data, content_view, elapsed)
 
     finally:
         # Always free the response handle
         lib.httpcloak_response_free(response_handle)
 
 
+def _parse_pooled_response(meta_ptr, content_view: memoryview, elapsed: float = 0.0) -> FastResponse:
+    """
+    Build a FastResponse over a body read by httpcloak_get_into.
+    content_view points straight at the pool buffer on the native side.
+    """
+    meta_str = _ptr_to_string(meta_ptr)
+    if meta_str is None:
+        raise HTTPCloakError("No response received")
+
+    data = _json_loads(meta_str)
+    if "error" in data:
+        raise HTTPCloakError(data["error"])
+
+    return _fast_response_from_meta(data, content_view, elapsed)
+
+
 def _add_params_to_url(url: str, params: Optional[Dict[str, Any]]) -> str:
     """Add query parameters to URL, preserving insertion order and encoding."""
     if not params:
@@ -1329,7 +1722,7 @@ def set_ech_dns_servers(servers: Optional[List[str]] = None) -> None:
     if servers is None or len(servers) == 0:
         lib.httpcloak_set_ech_dns_servers(None)
     else:
-        servers_json = json.dumps(servers).encode("utf-8")
+        servers_json = _json_dumps(servers)
         error_ptr = lib.httpcloak_set_ech_dns_servers(servers_json)
         if error_ptr:
             error = _ptr_to_string(error_ptr)
@@ -1369,6 +1762,10 @@ def _is_iterator(obj) -> bool:
         return False
 
 
+# Session options httpcloak_session_new2 accepts without a JSON config
+_POSITIONAL_SESSION_KEYS = frozenset(("preset", "proxy", "timeout", "http_version", "retry"))
+
+
 class Session:
     """
     HTTP Session with browser fingerprint emulation.
@@ -1455,10 +1852,11 @@ class Session:
         switch_protocol: Optional[str] = None,
         ja3: Optional[str] = None,
         akamai: Optional[str] = None,
-        extra_fp: Optional[Dict[str, any]] = None,
+        extra_fp: Optional[Dict[str, Any]] = None,
     ):
         self._lib = _get_lib()
         self._default_timeout = timeout
+        self._init_fast_pools()
         self.headers: Dict[str, str] = {}  # Default headers
         self.auth: Optional[Tuple[str, str]] = auth  # Default auth for all requests
 
@@ -1508,8 +1906,19 @@ class Session:
         if extra_fp:
             config["extra_fp"] = extra_fp
 
-        config_json = json.dumps(config).encode("utf-8")
-        self._handle = self._lib.httpcloak_session_new(config_json)
+        if (
+            config.keys() <= _POSITIONAL_SESSION_KEYS
+            and http_version == "auto"
+            and isinstance(timeout, int)
+            and isinstance(retry, int)
+        ):
+            # Common case: pass the few options positionally, no JSON round-trip
+            self._handle = self._lib.httpcloak_session_new2(
+                _utf8(preset), _utf8(proxy) if proxy else None, timeout, retry
+            )
+        else:
+            config_json = _json_dumps(config)
+            self._handle = self._lib.httpcloak_session_new(config_json)
 
         if self._handle == 0:
             raise HTTPCloakError("Failed to create session")
@@ -1525,10 +1934,16 @@ class Session:
 
     def close(self):
         """Close the session and release resources."""
+        if getattr(self, "_fast_pools", None) is not None:
+            self._fast_pools.close()
         if hasattr(self, "_handle") and self._handle:
             self._lib.httpcloak_session_free(self._handle)
             self._handle = 0
 
+    def _init_fast_pools(self):
+        """Set up the body pools used by get_fast()."""
+        self._fast_pools = _FastPools(self._lib)
+
     def refresh(self, switch_protocol: Optional[str] = None):
         """Refresh the session by closing all connections while keeping TLS session tickets.
 
@@ -1571,7 +1986,7 @@ class Session:
         if hasattr(self, "_handle") and self._handle:
             timeout_ms = timeout if timeout else 0
             result_ptr = self._lib.httpcloak_session_warmup(
-                self._handle, url.encode("utf-8"), timeout_ms
+                self._handle, _utf8(url), timeout_ms
             )
             if result_ptr is not None and result_ptr != 0:
                 result = _ptr_to_string(result_ptr)
@@ -1580,6 +1995,23 @@ class Session:
                     if "error" in data:
                         raise HTTPCloakError(data["error"])
 
+    async def warmup_async(self, url: str, timeout: Optional[int] = None):
+        """Async version of warmup().
+
+        Subresources are already fetched concurrently on the Go side; this
+        only keeps the event loop free while the page load runs, so several
+        sessions can be warmed at once with asyncio.gather().
+
+        Args:
+            url: The page URL to warm up (e.g., "https://example.com").
+            timeout: Timeout in milliseconds. Defaults to 60000 (60s).
+
+        Raises:
+            HTTPCloakError: If the navigation request fails.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.warmup, url, timeout)
+
     def fork(self, n: int = 1) -> List["Session"]:
         """Create n forked sessions sharing cookies and TLS session caches.
 
@@ -1605,6 +2037,7 @@ class Session:
             session._default_timeout = self._default_timeout
             session.headers = dict(self.headers) if self.headers else {}
             session.auth = self.auth
+            session._init_fast_pools()
             forks.append(session)
         return forks
 
@@ -1659,8 +2092,6 @@ class Session:
         Returns:
             Response object
         """
-        import json as json_module
-
         # Build options
         options = {
             "method": method,
@@ -1670,12 +2101,12 @@ class Session:
         if timeout:
             options["timeout"] = timeout
 
-        options_json = json_module.dumps(options).encode("utf-8")
+        options_json = _json_dumps(options)
 
         # Start the upload
         upload_handle = self._lib.httpcloak_upload_start(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             options_json,
         )
 
@@ -1710,7 +2141,7 @@ class Session:
                 raise HTTPCloakError("Empty response from streaming upload")
 
             # Parse the JSON response directly (don't call _parse_response which expects a pointer)
-            data = json_module.loads(result_bytes.decode("utf-8"))
+            data = _json_loads(result_bytes)
             if "error" in data:
                 raise HTTPCloakError(data["error"])
             return Response._from_dict(data, elapsed=elapsed)
@@ -1813,15 +2244,12 @@ class Session:
             return self.request("POST", url, headers=merged_headers, data=body, timeout=timeout)
 
         # Build options JSON with headers wrapper (clib expects {"headers": {...}})
-        options = {}
-        if merged_headers:
-            options["headers"] = merged_headers
-        options_json = json_module.dumps(options).encode("utf-8") if options else None
+        options_json = _encode_header_options(merged_headers)
 
         start_time = time.perf_counter()
         result = self._lib.httpcloak_post(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             body,
             options_json,
         )
@@ -1902,7 +2330,7 @@ class Session:
         start_time = time.perf_counter()
         result = self._lib.httpcloak_request(
             self._handle,
-            json_module.dumps(request_config).encode("utf-8"),
+            _json_dumps(request_config),
         )
         elapsed = time.perf_counter() - start_time
         return _parse_response(result, elapsed=elapsed)
@@ -2009,21 +2437,75 @@ class Session:
         callback_id, future = manager.register_request(self._lib)
 
         # Build options JSON with headers wrapper (clib expects {"headers": {...}})
-        options = {}
-        if merged_headers:
-            options["headers"] = merged_headers
-        options_json = json.dumps(options).encode("utf-8") if options else None
+        options_json = _encode_header_options(merged_headers)
 
         # Start async request
         self._lib.httpcloak_get_async(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             options_json,
             callback_id,
         )
 
         return await future
 
+    async def get_many(
+        self,
+        urls: List[str],
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+    ) -> List[Response]:
+        """
+        Perform many async GET requests concurrently using native Go goroutines.
+
+        Headers, cookies and auth are merged and encoded once for the whole
+        batch, and all requests are registered with a single lock acquisition
+        before being started.
+
+        Args:
+            urls: Request URLs
+            params: URL query parameters (applied to every URL)
+            headers: Request headers
+            cookies: Cookies to send with these requests
+            auth: Basic auth tuple (username, password)
+
+        Returns:
+            List of Response objects, in the same order as urls
+
+        Example:
+            responses = await session.get_many([url1, url2, url3])
+        """
+        if not urls:
+            return []
+
+        merged_headers = self._merge_headers(headers)
+        effective_auth = auth if auth is not None else self.auth
+        merged_headers = _apply_auth(merged_headers, effective_auth)
+        merged_headers = self._apply_cookies(merged_headers, cookies)
+
+        # Build options JSON with headers wrapper (clib expects {"headers": {...}})
+        options_json = _encode_header_options(merged_headers)
+
+        manager = _get_async_manager()
+        entries = manager.register_requests(self._lib, len(urls))
+
+        # Start all requests before awaiting any of them
+        try:
+            for url, (callback_id, _) in zip(urls, entries):
+                self._lib.httpcloak_get_async(
+                    self._handle,
+                    _utf8(_add_params_to_url(url, params)),
+                    options_json,
+                    callback_id,
+                )
+        except BaseException:
+            manager.discard_requests(self._lib, entries)
+            raise
+
+        return list(await asyncio.gather(*(future for _, future in entries)))
+
     async def post_async(
         self,
         url: str,
@@ -2073,15 +2555,12 @@ class Session:
         callback_id, future = manager.register_request(self._lib)
 
         # Build options JSON with headers wrapper (clib expects {"headers": {...}})
-        options = {}
-        if merged_headers:
-            options["headers"] = merged_headers
-        options_json = json.dumps(options).encode("utf-8") if options else None
+        options_json = _encode_header_options(merged_headers)
 
         # Start async request
         self._lib.httpcloak_post_async(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             body,
             options_json,
             callback_id,
@@ -2152,7 +2631,7 @@ class Session:
         # Start async request
         self._lib.httpcloak_request_async(
             self._handle,
-            json.dumps(request_config).encode("utf-8"),
+            _json_dumps(request_config),
             callback_id,
         )
 
@@ -2207,10 +2686,28 @@ class Session:
         """Set a cookie in the session."""
         self._lib.httpcloak_set_cookie(
             self._handle,
-            name.encode("utf-8"),
+            _utf8(name),
             value.encode("utf-8"),
         )
 
+    def set_cookies(self, cookies: Dict[str, str]):
+        """
+        Set several cookies in the session with a single native call.
+
+        Args:
+            cookies: Dict of cookie name -> value
+
+        Example:
+            session.set_cookies({"session_id": "abc123", "theme": "dark"})
+        """
+        if not cookies:
+            return
+        result = _ptr_to_string(self._lib.httpcloak_set_cookies(self._handle, _json_dumps(cookies)))
+        if result:
+            data = _json_loads(result)
+            if "error" in data:
+                raise HTTPCloakError(data["error"])
+
     def delete_cookie(self, name: str):
         """
         Delete a specific cookie by name.
@@ -2221,7 +2718,7 @@ class Session:
         # Set cookie to empty value - effectively deletes it
         self._lib.httpcloak_set_cookie(
             self._handle,
-            name.encode("utf-8"),
+            _utf8(name),
             b"",
         )
 
@@ -2231,9 +2728,7 @@ class Session:
 
         Note: This deletes all cookies by setting them to empty values.
         """
-        cookies = self.get_cookies()
-        for name in cookies:
-            self.delete_cookie(name)
+        self.set_cookies(dict.fromkeys(self.get_cookies(), ""))
 
     @property
     def cookies(self) -> Dict[str, str]:
@@ -2334,6 +2829,7 @@ class Session:
         session._default_timeout = 30
         session.headers = {}
         session.auth = None
+        session._init_fast_pools()
 
         return session
 
@@ -2365,6 +2861,7 @@ class Session:
         session._default_timeout = 30
         session.headers = {}
         session.auth = None
+        session._init_fast_pools()
 
         return session
 
@@ -2482,8 +2979,7 @@ class Session:
                 "sec-fetch-site", "sec-fetch-mode", "user-agent"
             ])
         """
-        order_json = json.dumps(order) if order else "[]"
-        order_bytes = order_json.encode("utf-8")
+        order_bytes = _json_dumps(order) if order else b"[]"
         result_ptr = self._lib.httpcloak_session_set_header_order(self._handle, order_bytes)
         result = _ptr_to_string(result_ptr)
         if result and "error" in result:
@@ -2575,16 +3071,13 @@ class Session:
             return self.request("GET", url, headers=merged_headers, timeout=timeout)
 
         # Build options JSON with headers wrapper (clib expects {"headers": {...}})
-        options = {}
-        if merged_headers:
-            options["headers"] = merged_headers
-        options_json = json.dumps(options).encode("utf-8") if options else None
+        options_json = _encode_header_options(merged_headers)
 
         start_time = time.perf_counter()
         # Use optimized raw response path for better performance
         response_handle = self._lib.httpcloak_get_raw(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             options_json,
         )
         elapsed = time.perf_counter() - start_time
@@ -2606,7 +3099,8 @@ class Session:
         High-performance GET request returning FastResponse with memoryview.
 
         This method is optimized for maximum download speed by:
-        - Using pre-allocated buffer pools (no per-request allocation)
+        - Reading into a per-thread native buffer pool reused across calls
+          (no per-request allocation)
         - Returning memoryview instead of bytes (zero-copy)
 
         Args:
@@ -2625,8 +3119,10 @@ class Session:
             data = bytes(r.content)  # Creates a copy
 
         Note:
-            The memoryview in FastResponse.content may be reused by subsequent
-            requests. If you need to keep the data, copy it with bytes(r.content).
+            FastResponse.content points directly at a native pool buffer. The
+            pool is reused for later requests only once the view and every
+            slice of it have been garbage collected, so holding on to it
+            ties up that buffer; copy with bytes(r.content) to keep the data.
         """
         # Use request auth if provided, otherwise fall back to session auth
         effective_auth = auth if auth is not None else self.auth
@@ -2637,23 +3133,31 @@ class Session:
         merged_headers = self._apply_cookies(merged_headers, cookies)
 
         # Build options JSON with headers wrapper
-        options = {}
-        if merged_headers:
-            options["headers"] = merged_headers
-        options_json = json.dumps(options).encode("utf-8") if options else None
+        options_json = _encode_header_options(merged_headers)
 
+        pools = self._fast_pools
+        pool = pools.acquire()
+        body_ptr = c_void_p()
+        body_len = c_size_t()
+        body_cap = c_size_t()
         start_time = time.perf_counter()
-        response_handle = self._lib.httpcloak_get_raw(
-            self._handle,
-            url.encode("utf-8"),
-            options_json,
-        )
+        try:
+            meta_ptr = self._lib.httpcloak_get_into(
+                self._handle,
+                pool,
+                _utf8(url),
+                options_json,
+                ctypes.byref(body_ptr),
+                ctypes.byref(body_len),
+                ctypes.byref(body_cap),
+            )
+        except BaseException:
+            pools.release(pool)
+            raise
         elapsed = time.perf_counter() - start_time
 
-        if response_handle < 0:
-            raise HTTPCloakError("Request failed")
-
-        return _parse_fast_response(self._lib, response_handle, elapsed=elapsed)
+        content_view = pools.lend(pool, body_ptr.value or 0, body_len.value, body_cap.value)
+        return _parse_pooled_response(meta_ptr, content_view, elapsed=elapsed)
 
     def post_fast(
         self,
@@ -2720,15 +3224,12 @@ class Session:
                 body_len = len(body_bytes)
 
         # Build options JSON with headers wrapper
-        options = {}
-        if merged_headers:
-            options["headers"] = merged_headers
-        options_json = json.dumps(options).encode("utf-8") if options else None
+        options_json = _encode_header_options(merged_headers)
 
         start_time = time.perf_counter()
         response_handle = self._lib.httpcloak_post_raw(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             body_bytes,
             body_len,
             options_json,
@@ -2818,7 +3319,7 @@ class Session:
         if timeout:
             request_config["timeout"] = timeout
 
-        request_json = json.dumps(request_config).encode("utf-8")
+        request_json = _json_dumps(request_config)
 
         start_time = time.perf_counter()
         response_handle = self._lib.httpcloak_request_raw(
@@ -2947,12 +3448,12 @@ class Session:
             options["headers"] = merged_headers
         if timeout:
             options["timeout"] = timeout
-        options_json = json.dumps(options).encode("utf-8") if options else None
+        options_json = _json_dumps(options) if options else None
 
         # Start stream
         stream_handle = self._lib.httpcloak_stream_get(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             options_json,
         )
 
@@ -2966,7 +3467,7 @@ class Session:
             self._lib.httpcloak_stream_close(stream_handle)
             raise HTTPCloakError("Failed to get stream metadata")
 
-        metadata = json.loads(metadata_str)
+        metadata = _json_loads(metadata_str)
         if "error" in metadata:
             self._lib.httpcloak_stream_close(stream_handle)
             raise HTTPCloakError(metadata["error"])
@@ -3046,12 +3547,12 @@ class Session:
             options["headers"] = merged_headers
         if timeout:
             options["timeout"] = timeout
-        options_json = json.dumps(options).encode("utf-8") if options else None
+        options_json = _json_dumps(options) if options else None
 
         # Start stream
         stream_handle = self._lib.httpcloak_stream_post(
             self._handle,
-            url.encode("utf-8"),
+            _utf8(url),
             body,
             options_json,
         )
@@ -3066,7 +3567,7 @@ class Session:
             self._lib.httpcloak_stream_close(stream_handle)
             raise HTTPCloakError("Failed to get stream metadata")
 
-        metadata = json.loads(metadata_str)
+        metadata = _json_loads(metadata_str)
         if "error" in metadata:
             self._lib.httpcloak_stream_close(stream_handle)
             raise HTTPCloakError(metadata["error"])
@@ -3142,7 +3643,7 @@ class Session:
         # Start stream
         stream_handle = self._lib.httpcloak_stream_request(
             self._handle,
-            json.dumps(request_config).encode("utf-8"),
+            _json_dumps(request_config),
         )
 
         if stream_handle < 0:
@@ -3155,7 +3656,7 @@ class Session:
             self._lib.httpcloak_stream_close(stream_handle)
             raise HTTPCloakError("Failed to get stream metadata")
 
-        metadata = json.loads(metadata_str)
+        metadata = _json_loads(metadata_str)
         if "error" in metadata:
             self._lib.httpcloak_stream_close(stream_handle)
             raise HTTPCloakError(metadata["error"])
@@ -3507,7 +4008,7 @@ class LocalProxy:
         if tls_only:
             config["tls_only"] = True
 
-        config_json = json.dumps(config).encode("utf-8")
+        config_json = _json_dumps(config)
         self._handle = self._lib.httpcloak_local_proxy_start(config_json)
 
         if self._handle < 0:
@@ -9,8 +9,16 @@ This example demonstrates:
 - Header order customization
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import httpcloak
 
+
+def parse_trace(body):
+    """Parse cloudflare trace response."""
+    return dict(line.split('=', 1) for line in body.splitlines() if '=' in line)
+
+
 # Configure global defaults
 print("=" * 60)
 print("Example 1: Configure Global Defaults")
@@ -42,14 +50,21 @@ presets = [
     "safari-18",
 ]
 
-for preset in presets:
-    session = httpcloak.Session(preset=preset)
-    r = session.get("https://www.cloudflare.com/cdn-cgi/trace")
+
+def probe_preset(preset):
+    """Fetch the trace page with one preset and return (preset, protocol, http)."""
+    with httpcloak.Session(preset=preset) as session:
+        r = session.get("https://www.cloudflare.com/cdn-cgi/trace")
 
     # Parse trace to get HTTP version
-    trace = dict(line.split("=", 1) for line in r.text.strip().split("\n") if "=" in line)
-    print(f"{preset:25} | Protocol: {r.protocol:5} | http={trace.get('http', 'N/A')}")
-    session.close()
+    trace = parse_trace(r.text)
+    return preset, r.protocol, trace.get("http", "N/A")
+
+
+# Each preset gets its own session, so the probes can run in parallel
+with ThreadPoolExecutor(max_workers=len(presets)) as executor:
+    for preset, protocol, http in executor.map(probe_preset, presets):
+        print(f"{preset:25} | Protocol: {protocol:5} | http={http}")
 
 # Force HTTP versions
 print("\n" + "=" * 60)
@@ -62,7 +77,7 @@ for version in http_versions:
     session = httpcloak.Session(preset="chrome-145", http_version=version)
     try:
         r = session.get("https://www.cloudflare.com/cdn-cgi/trace")
-        trace = dict(line.split("=", 1) for line in r.text.strip().split("\n") if "=" in line)
+        trace = parse_trace(r.text)
         print(f"http_version={version:5} | Actual Protocol: {r.protocol:5} | http={trace.get('http', 'N/A')}")
     except Exception as e:
         print(f"http_version={version:5} | Error: {e}")
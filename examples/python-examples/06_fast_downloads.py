@@ -9,6 +9,7 @@ What you'll learn:
 - Buffer pooling and memory efficiency
 - When to use get_fast() vs get()
 - Best practices for high-throughput scenarios
+- Serial latency vs concurrent throughput
 
 Performance comparison (100MB local file):
 - get():      ~500-1000 MB/s (safe, copies data)
@@ -21,6 +22,7 @@ Run:
     python 06_fast_downloads.py
 """
 
+import asyncio
 import time
 import httpcloak
 
@@ -71,15 +73,16 @@ print("-" * 50)
 
 response = session.get_fast("https://httpbin.org/bytes/1024")
 
-# The memoryview is only valid until the next get_fast() call
-# Copy it if you need to keep it
+# The memoryview keeps its native buffer reserved while it is referenced
+# Copy it and drop the response if you need to keep the data
 data_copy = bytes(response.content)
+del response
 print(f"Copied {len(data_copy)} bytes to keep after next request")
 
-# Now make another request - the original memoryview may be reused
+# Now make another request - it can reuse the first response's buffer
 response2 = session.get_fast("https://httpbin.org/bytes/1024")
 
-# data_copy is still valid, but response.content from first request is not
+# data_copy is independent of the pool
 print(f"data_copy still valid: {len(data_copy)} bytes")
 
 # =============================================================================
@@ -90,9 +93,9 @@ print("-" * 50)
 
 response = session.get_fast("https://httpbin.org/json")
 
-# Parse JSON directly from the memoryview (zero-copy)
-import json
-data = json.loads(response.content)
+# Parse JSON from the memoryview (decoded in place, no bytes copy;
+# json.loads() itself does not accept a memoryview)
+data = response.json()
 print(f"Parsed JSON with keys: {list(data.keys())}")
 
 # =============================================================================
@@ -107,7 +110,7 @@ test_url = "https://httpbin.org/bytes/102400"  # 100KB
 # Warmup
 session.get_fast(test_url)
 
-# Test get_fast()
+# Serial requests measure per-request latency (one round-trip at a time)
 iterations = 10
 total_bytes = 0
 start = time.perf_counter()
@@ -117,8 +120,8 @@ for _ in range(iterations):
 elapsed = time.perf_counter() - start
 
 speed_fast = (total_bytes / (1024 * 1024)) / elapsed
-print(f"get_fast(): {iterations} requests, {total_bytes/1024:.0f} KB")
-print(f"           Time: {elapsed*1000:.0f}ms, Speed: {speed_fast:.1f} MB/s")
+print(f"get_fast(): {iterations} serial requests, {total_bytes/1024:.0f} KB")
+print(f"           Serial latency: {elapsed*1000/iterations:.0f}ms/request, Speed: {speed_fast:.1f} MB/s")
 
 # Test regular get()
 total_bytes = 0
@@ -135,6 +138,20 @@ print(f"           Time: {elapsed*1000:.0f}ms, Speed: {speed_regular:.1f} MB/s")
 if speed_fast > speed_regular:
     print(f"\nget_fast() is {speed_fast/speed_regular:.1f}x faster!")
 
+# Concurrent requests measure throughput (all requests in flight at once)
+start = time.perf_counter()
+responses = asyncio.run(session.get_many([test_url] * iterations))
+elapsed_concurrent = time.perf_counter() - start
+
+total_concurrent = sum(len(r.content) for r in responses)
+speed_concurrent = (total_concurrent / (1024 * 1024)) / elapsed_concurrent
+print(f"get_many(): {iterations} concurrent requests, {total_concurrent/1024:.0f} KB")
+print(f"           Time: {elapsed_concurrent*1000:.0f}ms, Concurrent throughput: {speed_concurrent:.1f} MB/s")
+
+# If concurrent throughput is far above serial speed, round-trip latency
+# (network) dominates; if they are close, per-request work in the client does
+print(f"\nConcurrency speedup: {speed_concurrent/speed_fast:.1f}x over serial get_fast()")
+
 # =============================================================================
 # Example 5: When to Use get_fast() vs get()
 # =============================================================================
@@ -50,6 +50,12 @@ Use streaming when:
 
 session = httpcloak.Session(preset="chrome-145")
 
+# Sessions pinned to HTTP/2 and HTTP/3 for the protocol comparison in Example 5
+protocol_sessions = {
+    version: httpcloak.Session(preset="chrome-145", http_version=version)
+    for version in ("h2", "h3")
+}
+
 # =============================================================================
 # Example 1: Basic Streaming with iter_content()
 # =============================================================================
@@ -86,17 +92,37 @@ downloaded = 0
 print(f"Downloading {content_length} bytes...")
 start_time = time.perf_counter()
 
-for chunk in stream.iter_content(chunk_size=4096):
-    downloaded += len(chunk)
-
-    # Calculate progress
-    if content_length > 0:
-        percent = (downloaded / content_length) * 100
-        bar_width = 40
-        filled = int(bar_width * downloaded / content_length)
-        bar = "=" * filled + "-" * (bar_width - filled)
-        sys.stdout.write(f"\r[{bar}] {percent:.1f}%")
-        sys.stdout.flush()
+bar_width = 40
+bar_full = "=" * bar_width
+bar_empty = "-" * bar_width
+
+
+def render_progress(downloaded):
+    percent = downloaded * 100 / content_length
+    filled = downloaded * bar_width // content_length
+    bar = bar_full[:filled] + bar_empty[filled:]
+    sys.stdout.write(f"\r[{bar}] {percent:.1f}%")
+    sys.stdout.flush()
+
+
+chunks = stream.iter_content(chunk_size=4096)
+if content_length > 0:
+    # Redraw at most every 50ms rather than on every chunk - on large
+    # downloads rendering per chunk costs more than the download itself
+    next_render = 0.0
+    for chunk in chunks:
+        downloaded += len(chunk)
+        now = time.monotonic()
+        if now >= next_render:
+            render_progress(downloaded)
+            next_render = now + 0.05
+
+    # Always finish on the final state
+    render_progress(downloaded)
+else:
+    # Unknown length: nothing to draw a bar against
+    for chunk in chunks:
+        downloaded += len(chunk)
 
 elapsed = time.perf_counter() - start_time
 stream.close()
@@ -114,13 +140,11 @@ import os
 
 stream = session.get_stream("https://httpbin.org/bytes/102400")
 
+# write_to() hands the file descriptor to the native library, so the body
+# goes from the stream to disk without passing through Python at all
 with tempfile.NamedTemporaryFile(delete=False) as f:
     temp_path = f.name
-    bytes_written = 0
-
-    for chunk in stream.iter_content(chunk_size=16384):
-        f.write(chunk)
-        bytes_written += len(chunk)
+    bytes_written = stream.write_to(f)
 
 stream.close()
 
@@ -137,9 +161,13 @@ print("-" * 50)
 
 # StreamResponse supports context manager for automatic cleanup
 with session.get_stream("https://httpbin.org/bytes/32768") as stream:
-    chunks = list(stream.iter_content(chunk_size=8192))
-    print(f"Received {len(chunks)} chunks")
-    print(f"Total bytes: {sum(len(c) for c in chunks)}")
+    chunk_count = 0
+    total_bytes = 0
+    for chunk in stream.iter_content(chunk_size=8192):
+        chunk_count += 1
+        total_bytes += len(chunk)
+    print(f"Received {chunk_count} chunks")
+    print(f"Total bytes: {total_bytes}")
 # Stream is automatically closed here
 
 # =============================================================================
@@ -149,18 +177,14 @@ print("\n[5] Streaming with Different Protocols")
 print("-" * 50)
 
 # HTTP/2 streaming
-session_h2 = httpcloak.Session(preset="chrome-145", http_version="h2")
-with session_h2.get_stream("https://cloudflare.com/cdn-cgi/trace") as stream:
+with protocol_sessions["h2"].get_stream("https://cloudflare.com/cdn-cgi/trace") as stream:
     data = b"".join(stream.iter_content(chunk_size=1024))
     print(f"HTTP/2 stream: {len(data)} bytes, protocol: {stream.protocol}")
-session_h2.close()
 
 # HTTP/3 streaming
-session_h3 = httpcloak.Session(preset="chrome-145", http_version="h3")
-with session_h3.get_stream("https://cloudflare.com/cdn-cgi/trace") as stream:
+with protocol_sessions["h3"].get_stream("https://cloudflare.com/cdn-cgi/trace") as stream:
     data = b"".join(stream.iter_content(chunk_size=1024))
     print(f"HTTP/3 stream: {len(data)} bytes, protocol: {stream.protocol}")
-session_h3.close()
 
 # =============================================================================
 # Example 6: Streaming Lines (for text responses)
@@ -206,6 +230,8 @@ RECOMMENDATIONS:
 # Cleanup
 # =============================================================================
 session.close()
+for s in protocol_sessions.values():
+    s.close()
 
 print("\n" + "=" * 70)
 print("SUMMARY")
@@ -222,6 +248,8 @@ Streaming methods:
 StreamResponse methods:
 - stream.iter_content(chunk_size) - Iterate over chunks (bytes)
 - stream.iter_lines(chunk_size) - Iterate over lines (strings)
+- stream.readinto(buffer) - Read into a reusable buffer, returns bytes read
+- stream.write_to(file) - Write the rest of the body straight to a file
 - stream.close() - Close the stream
 
 StreamResponse properties:
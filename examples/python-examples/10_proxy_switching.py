@@ -17,12 +17,7 @@ TEST_URL = "https://www.cloudflare.com/cdn-cgi/trace"
 
 def parse_trace(body):
     """Parse cloudflare trace response to get IP and colo."""
-    result = {}
-    for line in body.strip().split('\n'):
-        if '=' in line:
-            key, val = line.split('=', 1)
-            result[key] = val
-    return result
+    return dict(line.split('=', 1) for line in body.splitlines() if '=' in line)
 
 
 # Basic proxy switching
@@ -19,6 +19,9 @@ Run:
 
 import httpcloak
 
+# Browser headers worth showing from the httpbin echo
+BROWSER_HEADER_PREFIXES = ("Sec-", "Accept", "User-Agent", "Priority", "Upgrade")
+
 # ============================================================
 # Example 1: Normal Mode (default behavior)
 # ============================================================
@@ -29,13 +32,13 @@ print("Example 1: Normal Mode (preset headers applied)")
 print("-" * 60)
 
 with httpcloak.Session(preset="chrome-145") as session:
-    response = session.get("https://httpbin.org/headers")
+    response = session.get_fast("https://httpbin.org/headers")
     headers = response.json().get("headers", {})
 
     print("Headers sent to server:")
-    for key, value in sorted(headers.items()):
-        if key.startswith(("Sec-", "Accept", "User-Agent", "Priority", "Upgrade")):
-            print(f"  {key}: {value[:60]}{'...' if len(value) > 60 else ''}")
+    for key in sorted(k for k in headers if k.startswith(BROWSER_HEADER_PREFIXES)):
+        value = headers[key]
+        print(f"  {key}: {value[:60]}{'...' if len(value) > 60 else ''}")
 
     print(f"\nTotal headers: {len(headers)}")
     print("Note: All Chrome preset headers are automatically included")
@@ -51,7 +54,7 @@ print("-" * 60)
 
 with httpcloak.Session(preset="chrome-145", tls_only=True) as session:
     # Only our custom headers will be sent
-    response = session.get("https://httpbin.org/headers", headers={
+    response = session.get_fast("https://httpbin.org/headers", headers={
         "User-Agent": "MyBot/1.0",
         "X-Custom-Header": "my-value",
     })
@@ -75,7 +78,7 @@ print("-" * 60)
 
 with httpcloak.Session(preset="chrome-145", tls_only=True) as session:
     # API-style request with custom headers
-    response = session.get("https://httpbin.org/headers", headers={
+    response = session.get_fast("https://httpbin.org/headers", headers={
         "Authorization": "Bearer my-api-token",
         "X-API-Key": "secret-key-123",
         "Content-Type": "application/json",
@@ -84,9 +87,8 @@ with httpcloak.Session(preset="chrome-145", tls_only=True) as session:
     headers = response.json().get("headers", {})
 
     print("API request headers:")
-    for key, value in sorted(headers.items()):
-        if not key.startswith("X-Amzn"):  # Skip AWS trace headers
-            print(f"  {key}: {value}")
+    for key in sorted(k for k in headers if not k.startswith("X-Amzn")):  # Skip AWS trace headers
+        print(f"  {key}: {headers[key]}")
 
     print("\nNo Sec-Ch-Ua or browser-specific headers leaked!")
 
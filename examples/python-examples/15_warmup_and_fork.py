@@ -7,20 +7,17 @@ This example demonstrates:
 - fork(n)  - create parallel sessions sharing cookies and TLS cache (like browser tabs)
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import httpcloak
-import threading
 
 TEST_URL = "https://www.cloudflare.com/cdn-cgi/trace"
 
 
 def parse_trace(body):
     """Parse cloudflare trace response."""
-    result = {}
-    for line in body.strip().split('\n'):
-        if '=' in line:
-            key, val = line.split('=', 1)
-            result[key] = val
-    return result
+    return dict(line.split('=', 1) for line in body.splitlines() if '=' in line)
 
 
 # ==========================================================
@@ -41,7 +38,7 @@ session.warmup("https://www.cloudflare.com")
 print("Warmup complete - TLS tickets, cookies, and cache populated")
 
 # Subsequent requests look like follow-up navigation from a real user
-r = session.get(TEST_URL)
+r = session.get_fast(TEST_URL)
 trace = parse_trace(r.text)
 print(f"Follow-up request: Protocol={r.protocol}, IP={trace.get('ip', 'N/A')}")
 
@@ -67,26 +64,26 @@ print("Parent session warmed up")
 tabs = session.fork(3)
 print(f"Forked into {len(tabs)} tabs")
 
-# Make parallel requests from each tab
-results = [None] * len(tabs)
+# Make parallel requests from each tab. get_async() runs on Go goroutines,
+# so all tabs are in flight at once without one OS thread per tab.
+async def fetch_all():
+    return await asyncio.gather(*[tab.get_async(TEST_URL) for tab in tabs])
 
-def fetch(tab, index):
-    r = tab.get(TEST_URL)
+results = []
+for r in asyncio.run(fetch_all()):
     trace = parse_trace(r.text)
-    results[index] = (r.protocol, trace.get("ip", "N/A"))
-
-threads = []
-for i, tab in enumerate(tabs):
-    t = threading.Thread(target=fetch, args=(tab, i))
-    threads.append(t)
-    t.start()
-
-for t in threads:
-    t.join()
+    results.append((r.protocol, trace.get("ip", "N/A")))
 
 for i, (proto, ip) in enumerate(results):
     print(f"  Tab {i}: Protocol={proto}, IP={ip}")
 
+# With the sync API, reuse a pool of workers rather than starting a thread
+# per tab, and handle each response as soon as it arrives
+with ThreadPoolExecutor(max_workers=len(tabs)) as pool:
+    futures = {pool.submit(tab.get, TEST_URL): i for i, tab in enumerate(tabs)}
+    for future in as_completed(futures):
+        print(f"  Tab {futures[future]} (sync): Protocol={future.result().protocol}")
+
 # Cookies set from any tab are visible in all others
 tabs[0].cookies = {"shared_cookie": "from_tab_0"}
 print(f"\nCookie set in tab 0, visible in parent: "
@@ -117,11 +114,23 @@ The recommended pattern for parallel scraping:
     session.warmup("https://example.com")
 
     tabs = session.fork(10)
-    for i, tab in enumerate(tabs):
-        threading.Thread(
-            target=lambda t, n: t.get(f"https://example.com/page/{n}"),
-            args=(tab, i)
-        ).start()
+
+    # Async: one goroutine per request, no extra Python threads
+    async def run():
+        return await asyncio.gather(*[
+            tab.get_async(f"https://example.com/page/{n}")
+            for n, tab in enumerate(tabs)
+        ])
+    responses = asyncio.run(run())
+
+    # Sync API: a bounded pool instead of a thread per tab
+    with ThreadPoolExecutor(max_workers=len(tabs)) as pool:
+        futures = [
+            pool.submit(tab.get, f"https://example.com/page/{n}")
+            for n, tab in enumerate(tabs)
+        ]
+        for future in as_completed(futures):
+            process(future.result())
 
 All forks share the same TLS fingerprint, cookies, and TLS session
 cache (for 0-RTT resumption), but have independent TCP/QUIC connections.